@@ -0,0 +1,86 @@
+"""Per-answer cost of quiz answer matching as the vocabulary grows.
+
+Variants are precomputed for every word of the fallback nouns and the verb index, then
+exact, accent-stripped, typo'd and wrong answers are checked against random words drawn
+from growing slices of that vocabulary. The mean should stay flat across slice sizes.
+
+    python benchmarks/bench_answer_match.py [--answers 20000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+from answer_matching import accepted_answers, is_correct, normalize
+
+
+def load_vocabulary():
+    from paths import FALLBACK_NOUNS_FILE, LOOKUP_FILE, VERB_INDEX_FILE
+
+    with open(FALLBACK_NOUNS_FILE, "r", encoding="utf-8") as f:
+        words = [(e["word"], e["definition"]) for e in json.load(f)]
+    if os.path.exists(LOOKUP_FILE) or os.path.exists(VERB_INDEX_FILE):
+        from verb_index import VerbIndex
+
+        words += VerbIndex.open().verbs()
+    else:
+        print("verb index not found, using fallback nouns only")
+    return words
+
+
+def typo(text):
+    if len(text) < 5:
+        return text
+    i = random.randrange(len(text) - 1)
+    return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+
+
+def guesses(answer):
+    sense = random.choice(sorted(accepted_answers(answer)))
+    return (answer, normalize(answer), typo(sense), "zzzz")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    words = load_vocabulary()
+    start = time.perf_counter()
+    for spanish, english in words:
+        accepted_answers(spanish)
+        accepted_answers(english)
+    elapsed = time.perf_counter() - start
+    print(f"precomputed {len(words)} words in {elapsed * 1000:.1f} ms")
+
+    size = 10
+    while True:
+        size = min(size, len(words))
+        vocabulary = words[:size]
+        cases = []
+        for _ in range(args.answers):
+            spanish, english = random.choice(vocabulary)
+            answer = random.choice((spanish, english))
+            cases.append((random.choice(guesses(answer)), accepted_answers(answer)))
+
+        start = time.perf_counter()
+        matched = sum(is_correct(guess, variants) for guess, variants in cases)
+        elapsed = time.perf_counter() - start
+        print(
+            f"vocabulary {size:>6}: {elapsed / len(cases) * 1e6:6.2f} us/answer"
+            f" ({matched}/{len(cases)} accepted)"
+        )
+        if size == len(words):
+            break
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Parse time and peak memory per conjugation page: BeautifulSoup tree vs fragment extraction.
+
+Runs on the saved pages in benchmarks/fixtures (spanishdict.com conjugation page
+layouts). conjugate_hablar.html is trimmed to the indicative, subjunctive and imperative
+tables; conjugate_hablar_full.html is the same page at full size (about 220 KB: inline
+CSS and component state, the progressive and perfect tables, examples, related verbs
+and footer links). It was assembled offline to the live page's layout rather than
+downloaded, so cell markup matches the live page but the filler text does not.
+conjugate_ser_renamed_class.html has a different table class, which the class-based
+lookup misses and the structural one still finds; conjugate_not_found.html has no
+conjugation table at all.
+
+Measured with --runs 20 (CPython 3.11):
+    page                   bs4                     fragment
+    conjugate_hablar       11 ms, 354 KB peak      0.28 ms, 15 KB peak
+    conjugate_hablar_full  71 ms, 2.6 MB peak      0.52 ms, 15 KB peak
+bs4 builds a tree of the whole page, so its cost grows with page size; the fragment
+extractor only regex-scans the one table that names the persons.
+
+    python benchmarks/bench_conjugation_extract.py [--runs 20]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+sys.path.insert(0, SRC_DIR)
+
+from conjugation_extract import extract_conjugation_table
+
+
+def extract_soup(html):
+    # Mirrors the previous DailyDataManager._scrape_conjugation
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", {"class": "sTe03NLF"})
+    if not table:
+        return None
+    return [
+        [cell.get_text(strip=True) for cell in row.find_all(["th", "td"])]
+        for row in table.find_all("tr")
+    ]
+
+
+def measure(extract, html, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = extract(html)
+    elapsed_ms = (time.perf_counter() - start) / runs * 1000
+
+    tracemalloc.start()
+    extract(html)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return result, elapsed_ms, peak_kb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    modes = [("fragment", extract_conjugation_table)]
+    try:
+        import bs4  # noqa: F401
+
+        modes.insert(0, ("bs4", extract_soup))
+    except ImportError:
+        print("bs4 not installed, only timing the fragment extractor")
+
+    for path in sorted(glob.glob(os.path.join(BENCH_DIR, "fixtures", "conjugate_*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        print(f"{os.path.basename(path)} ({len(html) // 1024} KB)")
+        for name, extract in modes:
+            table, elapsed_ms, peak_kb = measure(extract, html, args.runs)
+            found = f"{len(table)} rows" if table else "table not found"
+            print(f"  {name:<9}{elapsed_ms:8.2f} ms {peak_kb:9.0f} KB peak  {found}")
+
+
+if __name__ == "__main__":
+    main()
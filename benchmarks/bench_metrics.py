@@ -0,0 +1,55 @@
+"""Per-call overhead of metrics spans and counters, enabled and disabled.
+
+    python benchmarks/bench_metrics.py [--calls 200000]
+"""
+import argparse
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+from metrics import Metrics
+
+
+def per_call_ns(func, calls):
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+
+    def noop():
+        pass
+
+    baseline = per_call_ns(noop, args.calls)
+    print(f"plain call: {baseline:.0f} ns")
+
+    registries = []
+    for enabled in (True, False):
+        m = Metrics(enabled=enabled)
+        registries.append(m)
+        decorated = m.timed("noop")(noop)
+
+        def with_span():
+            with m.span("block"):
+                pass
+
+        print(f"[{'enabled' if enabled else 'disabled'}]")
+        print(f"  @timed:      +{per_call_ns(decorated, args.calls) - baseline:.0f} ns")
+        print(f"  span():      +{per_call_ns(with_span, args.calls) - baseline:.0f} ns")
+        print(f"  incr():      +{per_call_ns(lambda: m.incr('hits'), args.calls) - baseline:.0f} ns")
+
+    start = time.perf_counter_ns()
+    registries[0].snapshot()
+    print(f"snapshot (flush-time aggregation): {(time.perf_counter_ns() - start) / 1000:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Measure widget refresh time and Tk object counts over many consecutive regenerations.
+
+"reuse" drives the DailyView the app keeps for its whole lifetime; "rebuild" destroys and
+recreates it on every refresh, like the previous display_data. Needs a display (or Xvfb).
+
+    python benchmarks/bench_render.py [--refreshes 500] [--mode reuse|rebuild]
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+import tkinter as tk
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+from app import DailyView
+from conjugator import CONJUGATION_TENSES, PERSON_LABELS
+
+SAMPLE_EVERY = 50  # refreshes between object count samples
+
+
+def word():
+    return "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 10)))
+
+
+def random_bundle():
+    if random.random() < 0.05:
+        conjugation = [["Conjugation not found"]]  # exercises the grid shrinking
+    else:
+        conjugation = [[""] + list(CONJUGATION_TENSES)] + [
+            [label] + [word() for _ in CONJUGATION_TENSES] for label in PERSON_LABELS
+        ]
+    return {
+        "noun": {"spanish": word(), "english": word()},
+        "verb": {"spanish": word(), "english": word()},
+        "conjugation": conjugation,
+    }
+
+
+def widget_count(widget):
+    return 1 + sum(widget_count(child) for child in widget.winfo_children())
+
+
+def tcl_command_count(root):
+    # Every live widget and bound callback owns a Tcl command, so leaks show up here
+    return len(root.tk.call("info", "commands"))
+
+
+def run(mode, refreshes):
+    root = tk.Tk()
+    root.withdraw()
+    frame = tk.Frame(root)
+    frame.pack()
+    view = DailyView(frame)
+
+    times = []
+    samples = []
+    for n in range(1, refreshes + 1):
+        bundle = random_bundle()
+        start = time.perf_counter()
+        if mode == "rebuild":
+            for w in frame.winfo_children():
+                w.destroy()
+            view = DailyView(frame)
+        view.show(bundle)
+        root.update_idletasks()
+        times.append((time.perf_counter() - start) * 1000)
+        if n % SAMPLE_EVERY == 0:
+            samples.append((n, widget_count(root), tcl_command_count(root)))
+
+    root.destroy()
+
+    times.sort()
+    print(f"[{mode}] refreshes: {refreshes}")
+    print(f"  mean: {statistics.mean(times):.2f} ms, p95: {times[int(len(times) * 0.95)]:.2f} ms")
+    for n, widgets, commands in samples:
+        print(f"  after {n:>5}: {widgets} widgets, {commands} Tcl commands")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=500)
+    parser.add_argument("--mode", choices=("reuse", "rebuild"))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for mode in (args.mode,) if args.mode else ("reuse", "rebuild"):
+        random.seed(args.seed)
+        run(mode, args.refreshes)
+
+
+if __name__ == "__main__":
+    main()
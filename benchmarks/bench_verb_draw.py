@@ -0,0 +1,119 @@
+"""Compare random verb draws: JSON re-parse on every call vs the app's draw path.
+
+The app draws through DailyDataManager.random_verb: the next position from the
+persisted draw pool (one committed SQLite write per draw) and that verb from the
+index. The first draw also shuffles the pool, so it is reported separately. Each
+mode runs in its own process so the reported peak RSS is not polluted by the other;
+the app mode also loads the manager's imports.
+
+Without the Jehle lookup (it is not in the repo) a lookup of SYNTHETIC_VERBS made-up
+verbs is generated instead.
+
+    python benchmarks/bench_verb_draw.py [--draws 200] [--lookup path/to/jehle_verb_lookup.json]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+SYNTHETIC_VERBS = 600  # About the size of the Jehle verb list
+
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def draw_json(lookup):
+    # Mirrors the previous DailyDataManager.random_verb
+    with open(lookup, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    keys = list(data.keys())
+    random.shuffle(keys)
+    for key in keys:
+        for entry in data[key]:
+            if entry.get("tense") == "Present":
+                return entry["infinitive"], entry["translation"]
+
+
+def app_draw(index_path):
+    from data_manager import DailyDataManager
+    from logger import logger
+    from verb_index import VerbIndex
+
+    logger.disabled = True  # One INFO line per draw would dominate the timings
+
+    start = time.perf_counter()
+    manager = DailyDataManager(data_dir=tempfile.mkdtemp())
+    manager.verbs = VerbIndex(index_path)
+    print(f"  manager open: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    verb = manager.random_verb()
+    print(f"  first draw (shuffles the pool): {(time.perf_counter() - start) * 1000:.2f} ms")
+    assert verb.spanish != "error", "the draw fell back to the error verb"
+    return manager.random_verb
+
+
+def run_mode(mode, lookup, index_path, draws):
+    draw = (lambda: draw_json(lookup)) if mode == "json" else app_draw(index_path)
+
+    start = time.perf_counter()
+    for _ in range(draws):
+        draw()
+    elapsed = time.perf_counter() - start
+    print(f"  draws: {draws}, mean latency: {elapsed / draws * 1e6:.1f} us")
+    print(f"  peak RSS: {peak_rss_kb()} KB")
+
+
+def main():
+    from paths import LOOKUP_FILE
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--draws", type=int, default=200)
+    parser.add_argument("--lookup", default=LOOKUP_FILE)
+    parser.add_argument("--mode", choices=("json", "app"))
+    parser.add_argument("--index")
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.lookup, args.index, args.draws)
+        return
+
+    # Build once up front so the app process only pays for opening it
+    from verb_index import build_index
+
+    work_dir = tempfile.mkdtemp()
+    if not os.path.exists(args.lookup):
+        from conftest import write_verb_lookup
+
+        args.lookup = os.path.join(work_dir, "verb_lookup.json")
+        write_verb_lookup(
+            args.lookup, [(f"verbo{i}ar", f"to verb {i}") for i in range(SYNTHETIC_VERBS)]
+        )
+        print(f"No Jehle lookup, using {SYNTHETIC_VERBS} synthetic verbs")
+    index_path = os.path.join(work_dir, "verb_index.sqlite3")
+    build_index(args.lookup, index_path)
+
+    for mode in ("json", "app"):
+        print(f"[{mode}]", flush=True)
+        subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--lookup", args.lookup,
+             "--index", index_path, "--draws", str(args.draws)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Import throughput and peak memory of vocab_import for a large generated pack.
+
+The import runs in its own process against a temporary store so peak RSS only reflects
+the importer. Memory should stay flat as --rows grows.
+
+    python benchmarks/bench_vocab_import.py [--rows 300000] [--format csv|tsv|jsonl|txt]
+"""
+import argparse
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def word():
+    return "".join(random.choices(string.ascii_lowercase + "áéíóúñ", k=random.randint(4, 12)))
+
+
+def write_pack(path, fmt, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "txt":
+            f.write("#separator:tab\n#html:true\n")
+        for _ in range(rows):
+            spanish, english = word(), f"{word()}, {word()}"
+            if fmt == "jsonl":
+                f.write(json.dumps({"spanish": spanish, "english": english}) + "\n")
+            elif fmt == "csv":
+                f.write(f'{spanish},"{english}"\n')
+            else:
+                f.write(f"{spanish}\t{english}\n")
+
+
+def run_import(pack, store_path):
+    from vocab_import import import_pack
+    from vocabulary import VocabularyStore
+
+    store = VocabularyStore(store_path)
+    start = time.perf_counter()
+    read, added = import_pack(pack, store)
+    elapsed = time.perf_counter() - start
+    print(f"  rows: {read}, new words: {added}, store size: {len(store)}")
+    print(f"  {elapsed:.2f} s, {read / elapsed:.0f} rows/s")
+    print(f"  peak RSS: {peak_rss_kb()} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--format", choices=("csv", "tsv", "jsonl", "txt"), default="csv")
+    parser.add_argument("--pack")
+    parser.add_argument("--store")
+    args = parser.parse_args()
+
+    if args.pack:
+        run_import(args.pack, args.store)
+        return
+
+    tmp = tempfile.mkdtemp()
+    pack = os.path.join(tmp, f"pack.{args.format}")
+    write_pack(pack, args.format, args.rows)
+    print(f"[{args.format}] {os.path.getsize(pack) // 1024} KB pack", flush=True)
+    subprocess.run(
+        [sys.executable, __file__, "--pack", pack, "--store", os.path.join(tmp, "vocabulary.sqlite3")],
+        check=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Fixtures shared by the benchmark suite and the tests next to it."""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+sys.path.insert(0, SRC_DIR)
+
+
+class StubServer:
+    """
+    Local HTTP server for fetch tests. routes maps a path to a function taking
+    the request handler and returning (status, headers, body); requests keeps
+    (path, headers) of everything received.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests.append((self.path, dict(self.headers)))
+                route = stub.routes.get(self.path)
+                status, headers, body = route(self) if route else (404, {}, "")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                data = body.encode("utf-8")
+                if status != 304:
+                    self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if status != 304:
+                    self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self._server.server_port}{path}"
+
+    def hits(self, path):
+        return sum(1 for requested, _ in self.requests if requested == path)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    yield server
+    server.close()
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def write_verb_lookup(path, verbs):
+    """
+    Write a Jehle-style lookup JSON with every table tense for each (infinitive,
+    translation) in verbs, ready for verb_index.build_index.
+    """
+    import json
+
+    from conjugator import CONJUGATION_MOOD, CONJUGATION_TENSES
+
+    lookup = {
+        infinitive: [
+            {
+                "infinitive": infinitive,
+                "translation": translation,
+                "mood": CONJUGATION_MOOD,
+                "tense": tense,
+                **{f"form_{person}": f"{infinitive}-{tense}-{person}"
+                   for person in ("1s", "2s", "3s", "1p", "2p", "3p")},
+            }
+            for tense in CONJUGATION_TENSES
+        ]
+        for infinitive, translation in verbs
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(lookup, f)
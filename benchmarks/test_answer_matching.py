@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from answer_matching import accepted_answers, is_correct, max_typos, normalize
+from data_manager import DailyDataManager
+from review_scheduler import ReviewScheduler
+from search_index import SearchIndex
+from vocabulary import VocabularyStore
+
+NOUNS = [
+    {"word": "el perro", "definition": "the dog"},
+    {"word": "la mesa", "definition": "the table"},
+    {"word": "la misa", "definition": "the mass"},
+    {"word": "el año", "definition": "the year"},
+    {"word": "la ventana", "definition": "the window"},
+    {"word": "la montaña", "definition": "the mountain"},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    nouns_file = tmp_path / "nouns.json"
+    nouns_file.write_text(json.dumps(NOUNS), encoding="utf-8")
+    vocabulary = VocabularyStore(str(tmp_path / "vocabulary.sqlite3"))
+    index = SearchIndex.open(
+        None, vocabulary, path=str(tmp_path / "search.sqlite3"), nouns_file=str(nouns_file)
+    )
+    yield index
+    index.close()
+
+
+def check(guess, answer, is_known_word=None):
+    return is_correct(guess, accepted_answers(answer), is_known_word)
+
+
+def test_accents_are_optional_but_enye_is_not():
+    assert normalize("Árbol") == "arbol"
+    assert normalize("el Año") == "año"
+    assert check("arbol", "el árbol")
+    assert not check("ano", "el año")
+
+
+def test_no_typos_below_five_letters():
+    assert max_typos(4) == 0
+    assert not check("perro", "pero")
+    assert not check("misa", "la mesa")
+    assert check("ventanna", "la ventana")
+
+
+def test_near_miss_that_is_another_word_is_wrong(index):
+    assert not check("hablar", "hablas", {"hablar"}.__contains__)
+    assert check("habls", "hablas", {"hablar"}.__contains__)
+    assert not check("el perro", "perra", index.is_word)
+    assert not check("table", "the tables", index.is_word)
+
+
+def test_typos_still_accepted(index):
+    assert check("ventna", "la ventana", index.is_word)
+    assert check("the windw", "the window", index.is_word)
+    assert check("La Mesa!", "la mesa", index.is_word)
+    assert check("table", "the table, board", index.is_word)
+
+
+def test_search_keeps_enye_optional(index):
+    assert [match.spanish for match in index.spanish("ano")] == ["el año"]
+
+
+def test_expected_word_without_enye_is_not_another_word(index):
+    assert index.is_word("montana")  # the index folds ñ
+    assert check("montana", "la montaña") == check("montana", "la montaña", index.is_word)
+    assert check("montana", "la montaña", index.is_word)
+
+
+def test_known_word_check_never_waits_for_the_index(tmp_path):
+    manager = DailyDataManager(data_dir=str(tmp_path))
+    assert manager._search is None
+    assert manager.is_known_word("perro") is False
+    manager.reviews.close()
+
+
+def test_variants_are_stored_with_the_review(tmp_path):
+    path = str(tmp_path / "reviews.sqlite3")
+    reviews = ReviewScheduler(path)
+    reviews.add({"spanish": "el árbol", "english": "tree (plant)"})
+    reviews.close()
+
+    item = ReviewScheduler(path).peek()
+    assert item.variants["spanish"] == accepted_answers("el árbol")
+    assert item.variants["english"] == accepted_answers("tree (plant)")
@@ -0,0 +1,51 @@
+import pytest
+
+from conftest import read_fixture
+from conjugation_extract import extract_conjugation_table, is_conjugation_table
+from conjugator import CONJUGATION_TENSES, PERSON_LABELS
+
+HEADER = [""] + list(CONJUGATION_TENSES)
+
+HABLAR = [
+    HEADER,
+    ["yo", "hablo", "hablé", "hablaba", "hablaría", "hablaré"],
+    ["tú", "hablas", "hablaste", "hablabas", "hablarías", "hablarás"],
+    ["él/ella/Ud.", "habla", "habló", "hablaba", "hablaría", "hablará"],
+    ["nosotros", "hablamos", "hablamos", "hablábamos", "hablaríamos", "hablaremos"],
+    ["vosotros", "habláis", "hablasteis", "hablabais", "hablaríais", "hablaréis"],
+    ["ellos/ellas/Uds.", "hablan", "hablaron", "hablaban", "hablarían", "hablarán"],
+]
+
+SER = [
+    HEADER,
+    ["yo", "soy", "fui", "era", "sería", "seré"],
+    ["tú", "eres", "fuiste", "eras", "serías", "serás"],
+    ["él/ella/Ud.", "es", "fue", "era", "sería", "será"],
+    ["nosotros", "somos", "fuimos", "éramos", "seríamos", "seremos"],
+    ["vosotros", "sois", "fuisteis", "erais", "seríais", "seréis"],
+    ["ellos/ellas/Uds.", "son", "fueron", "eran", "serían", "serán"],
+]
+
+
+@pytest.mark.parametrize(
+    "fixture, expected",
+    [
+        ("conjugate_hablar.html", HABLAR),
+        ("conjugate_hablar_full.html", HABLAR),
+        ("conjugate_ser_renamed_class.html", SER),
+    ],
+)
+def test_extracts_the_indicative_table(fixture, expected):
+    table = extract_conjugation_table(read_fixture(fixture))
+    assert table == expected
+    assert [row[0] for row in table[1:]] == list(PERSON_LABELS)
+
+
+def test_page_without_a_conjugation_table():
+    assert extract_conjugation_table(read_fixture("conjugate_not_found.html")) is None
+
+
+def test_shape_check():
+    assert is_conjugation_table(HABLAR)
+    assert not is_conjugation_table(HABLAR[:3])
+    assert not is_conjugation_table([["borrar", "to erase"]] * 7)
@@ -0,0 +1,74 @@
+import pytest
+
+from draw_pool import DrawPools
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "draws.sqlite3")
+
+
+def test_no_repeats_until_exhausted(path):
+    pools = DrawPools(path)
+    first = [pools.draw("verbs", 10) for _ in range(10)]
+    assert sorted(first) == list(range(10))
+    assert pools.remaining("verbs") == 0
+
+    # A used-up pool starts over with a new shuffle of everything
+    second = [pools.draw("verbs", 10) for _ in range(10)]
+    assert sorted(second) == list(range(10))
+    pools.close()
+
+
+def test_skips_history_until_the_next_shuffle(path):
+    pools = DrawPools(path)
+    calls = []
+
+    def seen():
+        calls.append(1)
+        return [0, 2, 4]
+
+    drawn = [pools.draw("nouns", 6, seen) for _ in range(3)]
+    assert sorted(drawn) == [1, 3, 5]
+    assert len(calls) == 1  # only asked when the pool is built
+
+    # After that the whole vocabulary is back in play
+    drawn = [pools.draw("nouns", 6, seen) for _ in range(6)]
+    assert sorted(drawn) == list(range(6))
+    assert len(calls) == 1
+    pools.close()
+
+
+def test_everything_seen_falls_back_to_everything(path):
+    pools = DrawPools(path)
+    drawn = [pools.draw("nouns", 3, lambda: [0, 1, 2]) for _ in range(3)]
+    assert sorted(drawn) == [0, 1, 2]
+    pools.close()
+
+
+def test_survives_reopen(path):
+    pools = DrawPools(path)
+    drawn = [pools.draw("verbs", 8) for _ in range(3)]
+    pools.close()
+
+    pools = DrawPools(path)
+    assert pools.remaining("verbs") == 5
+    drawn += [pools.draw("verbs", 8, lambda: pytest.fail("pool was rebuilt")) for _ in range(5)]
+    assert sorted(drawn) == list(range(8))
+    pools.close()
+
+
+def test_pools_are_independent_and_resize(path):
+    pools = DrawPools(path)
+    pools.draw("verbs", 4)
+    pools.draw("nouns", 3)
+    assert (pools.remaining("verbs"), pools.remaining("nouns")) == (3, 2)
+
+    # A vocabulary that grew gets a fresh permutation over the new size
+    drawn = [pools.draw("nouns", 5) for _ in range(5)]
+    assert sorted(drawn) == list(range(5))
+    assert pools.remaining("missing") is None
+
+    with pytest.raises(LookupError):
+        pools.draw("empty", 0)
+    pools.close()
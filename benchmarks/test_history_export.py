@@ -0,0 +1,73 @@
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import history_export
+from history_export import conjugation_id, export, read_table
+from history_store import HistoryStore
+from review_scheduler import ReviewScheduler
+
+
+def day(offset):
+    return str(date.today() - timedelta(days=offset))
+
+
+def entry(verb):
+    return {
+        "noun": {"spanish": "la mesa", "english": "the table"},
+        "verb": {"spanish": verb, "english": "to " + verb},
+        "conjugation": [["", "Present"], ["yo", verb[:-2] + "o"]],
+    }
+
+
+@pytest.fixture
+def stores(tmp_path):
+    history = HistoryStore(str(tmp_path / "history.sqlite3"), None)
+    reviews = ReviewScheduler(str(tmp_path / "reviews.sqlite3"))
+    yield history, reviews
+    history.close()
+    reviews.close()
+
+
+def test_export_reads_only_new_days(tmp_path, stores):
+    history, reviews = stores
+    export_dir = str(tmp_path / "export")
+    history.put(day(3), entry("hablar"))
+    history.put(day(0), entry("comer"))  # today, still open
+    assert export(history, reviews, export_dir)["days"] == 1
+
+    history.put(day(2), entry("vivir"))
+    seen = []
+    items = history.items
+    history.items = lambda after="": seen.append(after) or items(after)
+    assert export(history, reviews, export_dir)["days"] == 1
+    assert seen == [day(3)]
+    assert read_table(export_dir, "days", ["verb_spanish"])[0].to_pylist() == ["hablar", "vivir"]
+
+
+def test_orphan_part_of_a_crashed_run_is_replaced(tmp_path, stores):
+    history, reviews = stores
+    export_dir = str(tmp_path / "export")
+    history.put(day(3), entry("hablar"))
+    export(history, reviews, export_dir)
+
+    # A run that wrote its parts but crashed before saving the state
+    vivir = entry("vivir")
+    orphan_id = conjugation_id("vivir", vivir["conjugation"])
+    history_export._write_part(
+        export_dir,
+        "conjugations",
+        2,
+        {"conjugation_id": [orphan_id], "verb": ["vivir"], "table": [vivir["conjugation"]]},
+    )
+    assert orphan_id not in read_table(export_dir, "conjugations")["conjugation_id"].to_pylist()
+
+    history.put(day(2), vivir)
+    history.put(day(1), entry("beber"))  # its part number is the orphan's
+    written = export(history, reviews, export_dir)
+
+    assert written["conjugations"] == 2
+    conjugations = read_table(export_dir, "conjugations")
+    assert conjugations["conjugation_id"].to_pylist().count(orphan_id) == 1
@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+
+import history_store
+from history_store import HistoryStore
+
+
+def entry(noun):
+    return {"noun": {"spanish": noun, "english": "x"}, "verb": {"spanish": "hablar"}, "conjugation": []}
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "history.sqlite3"), str(tmp_path / "history.json")
+
+
+def write_legacy(path, history):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, ensure_ascii=False)
+
+
+def test_migrates_history_json_once(paths):
+    db, legacy = paths
+    write_legacy(legacy, {"2024-01-02": entry("el niño"), "2024-01-01": entry("la mesa")})
+
+    store = HistoryStore(db, legacy)
+    assert list(store.items()) == [("2024-01-01", entry("la mesa")), ("2024-01-02", entry("el niño"))]
+    store.put("2024-01-03", entry("el libro"))
+    store.close()
+    assert not os.path.exists(legacy)
+    assert os.path.exists(legacy + ".migrated")
+
+    # Reopening does not import again
+    store = HistoryStore(db, legacy)
+    assert len(store) == 3
+    store.close()
+
+
+def test_stored_days_win_over_a_restored_legacy_file(paths):
+    db, legacy = paths
+    write_legacy(legacy, {"2024-01-01": entry("la mesa")})
+    HistoryStore(db, legacy).close()
+
+    store = HistoryStore(db, legacy)
+    store.put("2024-01-01", entry("el perro"))
+    store.close()
+
+    # The old file shows up again (restored from a backup, say)
+    write_legacy(legacy, {"2024-01-01": entry("la mesa"), "2023-12-31": entry("el gato")})
+    store = HistoryStore(db, legacy)
+    assert dict(store.items()) == {"2023-12-31": entry("el gato"), "2024-01-01": entry("el perro")}
+    store.close()
+    assert not os.path.exists(legacy)
+
+
+def test_corrupt_legacy_file_is_left_alone(paths):
+    db, legacy = paths
+    with open(legacy, "w", encoding="utf-8") as f:
+        f.write('{"2024-01-01": {"noun"')
+
+    store = HistoryStore(db, legacy)
+    assert len(store) == 0
+    store.put("2024-01-02", entry("la mesa"))
+    assert store.get("2024-01-02") == entry("la mesa")
+    store.close()
+    assert os.path.exists(legacy)
+
+
+def test_items_pages_through_every_day(paths, monkeypatch):
+    monkeypatch.setattr(history_store, "ITER_BATCH_SIZE", 4)
+    db, legacy = paths
+    days = [f"2024-01-{day:02d}" for day in range(1, 11)]
+    write_legacy(legacy, {day: entry(day) for day in days})
+
+    store = HistoryStore(db, legacy)
+    assert [day for day, _ in store.items()] == days
+    assert [day for day, _ in store.items(after="2024-01-08")] == days[8:]
+    assert "2024-01-05" in store and "2024-02-01" not in store
+    store.close()
@@ -0,0 +1,205 @@
+"""pytest-benchmark suite for the hot paths, headless and offline.
+
+The app runs on the headless platform backend (no click-through window, no tray icon),
+keeps its stores in a temporary data dir and talks to a stub HTTP client that serves
+the saved pages in benchmarks/fixtures. Verbs come from a small fixture index built
+in the data dir. Without a display the backend builds the window from the in-memory
+widgets in headless_tk, so the view benchmarks time the app's own work (diffing,
+layout calls, scheduling) but not Tcl drawing; with a display they use real Tk.
+
+    python -m pytest benchmarks -q [--benchmark-autosave] [--benchmark-compare]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+sys.path.insert(0, SRC_DIR)
+
+import http_client
+from conftest import write_verb_lookup
+from conjugator import CONJUGATION_TENSES, PERSON_LABELS
+from data_manager import DailyDataManager, scrape_conjugation
+from platform_backend import HeadlessBackend
+from review_scheduler import ReviewScheduler
+from verb_index import VerbIndex, build_index
+
+REVIEW_ITEMS = 5000  # Nouns in the quiz backlog for the scheduling benchmarks
+VERBS = [("hablar", "to speak"), ("comer", "to eat"), ("vivir", "to live"), ("tener", "to have")]
+
+with open(os.path.join(BENCH_DIR, "fixtures", "conjugate_hablar.html"), encoding="utf-8") as f:
+    CONJUGATION_PAGE = f.read()
+
+
+class StubResponse:
+    def __init__(self, status_code=200, text="", payload=None):
+        self.status_code = status_code
+        self.text = text
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class StubHttp:
+    """Answers the noun API with a fixed word and every conjugation URL with the saved page."""
+
+    def get(self, url, timeout=None, revalidate=True):
+        if "/conjugate/" in url:
+            return StubResponse(text=CONJUGATION_PAGE)
+        return StubResponse(payload=[{"word": "la mesa", "definition": "the table"}])
+
+
+def bundle(i=0):
+    return {
+        "noun": {"spanish": f"sustantivo{i}", "english": f"noun{i}"},
+        "verb": {"spanish": f"verbo{i}", "english": f"verb{i}"},
+        "conjugation": [[""] + list(CONJUGATION_TENSES)]
+        + [[label] + [f"{label}{i}{tense}" for tense in CONJUGATION_TENSES] for label in PERSON_LABELS],
+    }
+
+
+@pytest.fixture
+def stub_http(monkeypatch):
+    monkeypatch.setattr(http_client, "get_client", StubHttp)
+
+
+@pytest.fixture
+def verbs(tmp_path):
+    lookup = str(tmp_path / "verb_lookup.json")
+    write_verb_lookup(lookup, VERBS)
+    build_index(lookup, str(tmp_path / "verbs.sqlite3"))
+    index = VerbIndex(str(tmp_path / "verbs.sqlite3"))
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def manager(tmp_path, stub_http, verbs):
+    manager = DailyDataManager(data_dir=str(tmp_path))
+    manager.verbs = verbs
+    yield manager
+    manager.reviews.close()
+
+
+def seed_today(data_dir):
+    """Store today's bundle so the app starts from history instead of fetching."""
+    manager = DailyDataManager(data_dir=data_dir)
+    data = bundle()
+    manager.save_today(data["noun"], data["verb"], data["conjugation"])
+    manager.reviews.close()
+
+
+def start_app(data_dir):
+    from app import SpanishWidgetApp
+
+    with open(os.path.join(data_dir, "settings.json"), "w", encoding="utf-8") as f:
+        json.dump({"metrics_enabled": False}, f)
+    return SpanishWidgetApp(backend=HeadlessBackend(), data_dir=data_dir)
+
+
+@pytest.fixture
+def app(tmp_path, stub_http):
+    seed_today(str(tmp_path))
+    app = start_app(str(tmp_path))
+    yield app
+    app.quit()
+
+
+# --- Data generation ---
+def test_data_generation(benchmark, manager):
+    def generate():
+        noun = manager.random_noun()
+        verb = manager.random_verb()
+        return noun, verb, manager.conjugation(verb.spanish)
+
+    noun, verb, conjugation = benchmark(generate)
+    assert noun.spanish == "la mesa"
+    assert (verb.spanish, verb.english) in VERBS
+    assert conjugation[1][1] == f"{verb.spanish}-Present-1s"
+
+
+def test_conjugation_scrape(benchmark):
+    table = benchmark(scrape_conjugation, StubHttp(), "hablar")
+    assert table
+
+
+def test_search(benchmark, manager):
+    manager.search_index  # built once, outside the timing
+    queries = ["tuvimos", "arbol", "tre", "ca", "to have"]
+    count = iter(range(10**9))
+
+    benchmark(lambda: manager.search(queries[next(count) % len(queries)]))
+
+
+def test_review_peek_record(benchmark, tmp_path):
+    reviews = ReviewScheduler(str(tmp_path / "reviews.sqlite3"))
+    now = time.time()
+    for i in range(REVIEW_ITEMS):
+        reviews.add({"spanish": f"palabra{i}", "english": f"word{i}"}, now=now - i)
+
+    def answer_next():
+        item = reviews.peek()
+        reviews.record(item.spanish, random.random() < 0.8, now=now)
+
+    benchmark(answer_next)
+    reviews.close()
+
+
+# --- View paths (real Tk with a display, headless_tk without) ---
+def test_startup(benchmark, tmp_path, stub_http):
+    apps = []
+
+    def setup():
+        data_dir = str(tmp_path / f"round{len(apps)}")
+        os.makedirs(data_dir)
+        seed_today(data_dir)
+        return (data_dir,), {}
+
+    def start(data_dir):
+        apps.append(start_app(data_dir))
+
+    benchmark.pedantic(start, setup=setup, rounds=5)
+    for app in apps:
+        app.quit()
+
+
+def test_display_data(benchmark, app):
+    bundles = [bundle(i) for i in range(10)]
+    count = iter(range(10**9))
+
+    def display():
+        app.display_data(bundles[next(count) % len(bundles)])
+        app.root.update_idletasks()
+
+    benchmark(display)
+
+
+def test_highlight_column(benchmark, app):
+    table = app.view.conjugation
+    columns = len(CONJUGATION_TENSES)
+    count = iter(range(10**9))
+
+    def highlight():
+        table.highlight_column(1 + next(count) % columns)
+        app.root.update_idletasks()
+
+    benchmark(highlight)
+
+
+def test_schedule_quiz(benchmark, app):
+    now = time.time()
+    for i in range(REVIEW_ITEMS):
+        app.manager.reviews.add({"spanish": f"palabra{i}", "english": f"word{i}"}, now=now + i)
+    benchmark(app.schedule_quiz)
+    assert app._quiz_job is not None
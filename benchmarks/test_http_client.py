@@ -0,0 +1,103 @@
+import time
+
+import pytest
+import requests
+
+import http_client
+from http_client import HttpClient
+
+
+def client(**kwargs):
+    kwargs.setdefault("backoff_factor", 0)
+    kwargs.setdefault("burst", 100)
+    return HttpClient(**kwargs)
+
+
+def test_etag_revalidation_serves_stored_body(stub_server):
+    def page(handler):
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, ""
+        return 200, {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"}, "<p>hola</p>"
+
+    stub_server.routes["/page"] = page
+    http = client()
+    first = http.get(stub_server.url("/page"))
+    second = http.get(stub_server.url("/page"))
+
+    assert first.status_code == second.status_code == 200
+    assert second.text == "<p>hola</p>"
+    assert stub_server.requests[1][1].get("If-None-Match") == '"v1"'
+
+
+def test_last_modified_revalidation(stub_server):
+    stamp = "Wed, 01 Oct 2025 10:00:00 GMT"
+
+    def page(handler):
+        if handler.headers.get("If-Modified-Since") == stamp:
+            return 304, {}, ""
+        return 200, {"Last-Modified": stamp}, "[1]"
+
+    stub_server.routes["/api"] = page
+    http = client()
+    http.get(stub_server.url("/api"))
+    assert http.get(stub_server.url("/api")).json() == [1]
+    assert stub_server.hits("/api") == 2
+
+
+def test_no_revalidation_when_disabled(stub_server):
+    stub_server.routes["/api"] = lambda handler: (200, {"ETag": '"x"'}, "[]")
+    http = client()
+    http.get(stub_server.url("/api"), revalidate=False)
+    http.get(stub_server.url("/api"), revalidate=False)
+    assert all("If-None-Match" not in headers for _, headers in stub_server.requests)
+
+
+def test_revalidation_store_is_bounded(stub_server, monkeypatch):
+    monkeypatch.setattr(http_client, "MAX_VALIDATED", 2)
+    for path in ("/a", "/b", "/c"):
+        stub_server.routes[path] = lambda handler: (200, {"ETag": '"x"'}, "body")
+    http = client()
+    for path in ("/a", "/b", "/c"):
+        http.get(stub_server.url(path))
+    assert list(http._validated) == [stub_server.url("/b"), stub_server.url("/c")]
+
+
+def test_retries_server_errors(stub_server):
+    statuses = iter([503, 502, 200])
+    stub_server.routes["/flaky"] = lambda handler: (next(statuses), {}, "ok")
+    resp = client(retries=2).get(stub_server.url("/flaky"))
+    assert resp.status_code == 200
+    assert stub_server.hits("/flaky") == 3
+
+
+def test_gives_up_after_retries(stub_server):
+    stub_server.routes["/down"] = lambda handler: (503, {}, "down")
+    resp = client(retries=2).get(stub_server.url("/down"))
+    assert resp.status_code == 503
+    assert stub_server.hits("/down") == 3
+
+
+def test_backoff_spaces_retries(stub_server):
+    statuses = iter([503, 503, 200])
+    stub_server.routes["/flaky"] = lambda handler: (next(statuses), {}, "ok")
+    start = time.perf_counter()
+    client(retries=2, backoff_factor=0.1).get(stub_server.url("/flaky"))
+    assert time.perf_counter() - start >= 0.1
+
+
+def test_timeout(stub_server):
+    def slow(handler):
+        time.sleep(1)
+        return 200, {}, "late"
+
+    stub_server.routes["/slow"] = slow
+    start = time.perf_counter()
+    with pytest.raises(requests.RequestException):
+        client(timeout=0.1, retries=0).get(stub_server.url("/slow"))
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 4), (-1, 4), (2, 0)])
+def test_rejects_a_rate_that_cannot_be_waited_on(rate, burst):
+    with pytest.raises(ValueError):
+        client(rate=rate, burst=burst)
@@ -0,0 +1,122 @@
+import os
+import sqlite3
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+import http_client
+from data_manager import DailyDataManager
+from paths import SETTINGS_FILE
+from platform_backend import HeadlessBackend
+from prefetch import Prefetcher, PrefetchQueue
+from profiles import DEFAULT_PROFILE, migrate_to_profiles, profile_dir, profile_file
+
+
+def write(path, text="{}"):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_migration_survives_an_earlier_profile_lookup(tmp_path):
+    data_dir = str(tmp_path)
+    write(os.path.join(data_dir, "settings.json"), '{"quiz_interval": 60}')
+    write(os.path.join(data_dir, "history.sqlite3"), "")
+    write(os.path.join(data_dir, "history.sqlite3-wal"), "")
+
+    # A CLI resolving a path first creates profiles/default/
+    profile_file(SETTINGS_FILE, data_dir)
+    migrate_to_profiles(data_dir)
+
+    default = profile_dir(DEFAULT_PROFILE, data_dir)
+    assert sorted(os.listdir(default)) == ["history.sqlite3", "history.sqlite3-wal", "settings.json"]
+    assert not os.path.exists(os.path.join(data_dir, "settings.json"))
+
+
+def test_migration_keeps_the_profile_copy(tmp_path):
+    data_dir = str(tmp_path)
+    default = profile_dir(DEFAULT_PROFILE, data_dir)
+    write(os.path.join(default, "settings.json"), '{"quiz_interval": 60}')
+    write(os.path.join(data_dir, "settings.json"), '{"quiz_interval": 5}')
+
+    migrate_to_profiles(data_dir)
+
+    with open(os.path.join(default, "settings.json"), encoding="utf-8") as f:
+        assert f.read() == '{"quiz_interval": 60}'
+
+
+def test_open_profile_closes_the_previous_stores(tmp_path):
+    manager = DailyDataManager(data_dir=str(tmp_path), profile_dir=profile_dir("a", str(tmp_path)))
+    old = (manager.history, manager.reviews, manager.draws)
+    manager.open_profile(profile_dir("b", str(tmp_path)))
+
+    assert manager.reviews is not old[1]
+    for store in old:
+        with pytest.raises(sqlite3.ProgrammingError):
+            store._conn.execute("SELECT 1")
+    manager.reviews.close()
+
+
+def test_stopped_fill_does_not_reach_the_new_queue(tmp_path):
+    release = threading.Event()
+    started = threading.Event()
+
+    def random_noun(fallback=True):
+        started.set()
+        release.wait(5)
+        return SimpleNamespace(spanish="la mesa", english="the table")
+
+    manager = SimpleNamespace(
+        random_noun=random_noun,
+        random_verb=lambda: SimpleNamespace(spanish="hablar", english="to speak"),
+        conjugation=lambda verb: [["x"]],
+    )
+    old_queue = PrefetchQueue(str(tmp_path / "old.json"))
+    prefetcher = Prefetcher(mock.Mock(), manager, size=1, queue=old_queue)
+    prefetcher.refill()
+    thread = prefetcher._thread
+    assert started.wait(5)
+
+    prefetcher.stop()
+    prefetcher.queue = PrefetchQueue(str(tmp_path / "new.json"))
+    release.set()
+    thread.join(5)
+
+    assert len(prefetcher.queue) == 0
+    assert len(old_queue) == 0
+
+
+def seed_profile(data_dir, name, noun):
+    write(os.path.join(profile_dir(name, data_dir), "settings.json"),
+          '{"metrics_enabled": false, "prefetch_size": 0}')
+    manager = DailyDataManager(data_dir=data_dir, profile_dir=profile_dir(name, data_dir))
+    manager.save_today(
+        {"spanish": noun, "english": "noun"}, {"spanish": "hablar", "english": "to speak"}, [["x"]]
+    )
+    manager.reviews.close()
+
+
+def test_switch_profile_drops_the_pending_retry(tmp_path, monkeypatch):
+    from app import FETCH_RETRY_MIN, SpanishWidgetApp
+
+    monkeypatch.setattr(http_client, "get_client", mock.Mock)
+    data_dir = str(tmp_path)
+    seed_profile(data_dir, DEFAULT_PROFILE, "la mesa")
+    seed_profile(data_dir, "b", "el libro")
+    app = SpanishWidgetApp(backend=HeadlessBackend(stub=True), data_dir=data_dir)
+    try:
+        # A fetch failed in the first profile and its retry is waiting
+        app._on_data_failed(RuntimeError("offline"))
+        app._on_data_failed(RuntimeError("offline"))
+        job = app._retry_job
+        assert job in app.root.pending()
+
+        app.switch_profile("b")
+
+        assert app._retry_job is None
+        assert job not in app.root.pending()
+        assert app._retry_delay == FETCH_RETRY_MIN
+        assert app.manager.get_today()["noun"]["spanish"] == "el libro"
+    finally:
+        app.quit()
@@ -0,0 +1,99 @@
+import pytest
+
+from review_scheduler import (
+    DAY,
+    DEFAULT_EASE,
+    MIN_EASE,
+    RELEARN_INTERVAL,
+    ReviewScheduler,
+)
+
+NOW = 1_700_000_000.0
+
+
+def noun(spanish, english="x"):
+    return {"spanish": spanish, "english": english}
+
+
+@pytest.fixture
+def reviews(tmp_path):
+    reviews = ReviewScheduler(str(tmp_path / "reviews.sqlite3"))
+    yield reviews
+    reviews.close()
+
+
+def test_correct_answers_grow_the_interval(reviews):
+    reviews.add(noun("la mesa"), now=NOW)
+    item = reviews.peek()
+
+    steps = []
+    now = NOW
+    for _ in range(4):
+        reviews.record("la mesa", True, now=now)
+        steps.append((item.repetitions, item.interval / DAY, item.ease))
+        now = item.due_at
+
+    # Grade 4 keeps the ease where it is: 1 day, 6 days, then interval * ease
+    assert steps == [(1, 1, DEFAULT_EASE), (2, 6, DEFAULT_EASE), (3, 15, DEFAULT_EASE), (4, 37.5, DEFAULT_EASE)]
+    assert item.due_at == now
+
+
+def test_wrong_answer_relearns_and_lowers_the_ease(reviews):
+    reviews.add(noun("la mesa"), now=NOW)
+    item = reviews.peek()
+    reviews.record("la mesa", True, now=NOW)
+    reviews.record("la mesa", True, now=NOW)
+
+    reviews.record("la mesa", False, now=NOW)
+    assert item.repetitions == 0
+    assert item.interval == RELEARN_INTERVAL
+    assert item.due_at == NOW + RELEARN_INTERVAL
+    assert item.ease == pytest.approx(DEFAULT_EASE - 0.54)
+
+    for _ in range(5):
+        reviews.record("la mesa", False, now=NOW)
+    assert item.ease == MIN_EASE
+
+    # Back to the first step after a miss
+    reviews.record("la mesa", True, now=NOW)
+    assert item.interval == DAY
+
+
+def test_peek_returns_the_item_due_soonest(reviews):
+    reviews.add(noun("el libro"), now=NOW + 30)
+    reviews.add(noun("la mesa"), now=NOW + 10)
+    reviews.add(noun("el perro"), now=NOW + 20)
+    reviews.add(noun("la mesa", "ignored"), now=NOW)  # already tracked
+
+    assert len(reviews) == 3
+    assert reviews.peek().spanish == "la mesa"
+
+    reviews.record("la mesa", True, now=NOW + 40)  # due in a day
+    assert reviews.peek().spanish == "el perro"
+    reviews.record("el perro", False, now=NOW + 40)  # due in ten minutes
+    assert reviews.peek().spanish == "el libro"
+    reviews.record("el libro", True, now=NOW + 40)
+    assert reviews.peek().spanish == "el perro"
+
+
+def test_state_survives_reopen(tmp_path):
+    path = str(tmp_path / "reviews.sqlite3")
+    reviews = ReviewScheduler(path)
+    reviews.add(noun("la mesa", "the table"), now=NOW)
+    reviews.add(noun("el libro", "the book"), now=NOW + 5)
+    reviews.record("la mesa", True, now=NOW)
+    reviews.record("el libro", False, now=NOW + 1)
+    reviews.close()
+
+    reopened = ReviewScheduler(path)
+    try:
+        item = reopened.peek()
+        assert item.spanish == "el libro"
+        assert (item.repetitions, item.interval, item.due_at) == (0, RELEARN_INTERVAL, NOW + 1 + RELEARN_INTERVAL)
+        assert item.variants["spanish"] == frozenset({"libro"})
+        assert [(spanish, correct) for _, spanish, _, correct in reopened.answers()] == [
+            ("la mesa", 1),
+            ("el libro", 0),
+        ]
+    finally:
+        reopened.close()
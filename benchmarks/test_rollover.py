@@ -0,0 +1,107 @@
+import heapq
+import time
+from datetime import date, datetime
+
+import pytest
+
+import rollover
+from headless_tk import Tk
+from rollover import MAX_TIMER_DELAY, ROLLOVER_GRACE, RolloverScheduler, seconds_until_midnight
+
+HOUR = 60 * 60  # In seconds
+
+pytestmark = pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset (POSIX)")
+
+
+@pytest.fixture
+def zone(monkeypatch):
+    """Switch the process's local time zone for the test."""
+
+    def use(name):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+
+    yield use
+    monkeypatch.undo()
+    time.tzset()
+
+
+def at(iso):
+    return datetime.fromisoformat(iso).timestamp()
+
+
+@pytest.mark.parametrize(
+    "name, now, hours",
+    [
+        # Normal day, from midnight and from noon
+        ("America/New_York", "2024-06-14T00:00-04:00", 24),
+        ("America/New_York", "2024-06-14T12:00-04:00", 12),
+        # Spring forward (02:00 -> 03:00) and fall back (02:00 -> 01:00)
+        ("America/New_York", "2024-03-10T00:00-05:00", 23),
+        ("America/New_York", "2024-11-03T00:00-04:00", 25),
+        # Santiago springs forward at midnight: 2024-09-08 starts at 01:00
+        ("America/Santiago", "2024-09-07T00:00-04:00", 24),
+        ("America/Santiago", "2024-09-08T01:00-03:00", 23),
+        # and falls back at midnight: 23:00-24:00 on 2024-04-06 happens twice
+        ("America/Santiago", "2024-04-06T00:00-03:00", 25),
+        ("America/Santiago", "2024-04-06T23:30-03:00", 1.5),
+        ("America/Santiago", "2024-04-06T23:30-04:00", 0.5),
+        # Havana falls back from 01:00 to midnight: the date changes at the first one
+        ("America/Havana", "2024-11-02T12:00-04:00", 12),
+        ("America/Havana", "2024-11-03T00:00-04:00", 25),
+        ("America/Havana", "2024-11-03T00:30-05:00", 23.5),
+        # and springs forward at midnight: 2024-03-10 starts at 01:00
+        ("America/Havana", "2024-03-09T12:00-05:00", 12),
+    ],
+)
+def test_seconds_until_midnight(zone, name, now, hours):
+    zone(name)
+    assert seconds_until_midnight(at(now)) == hours * HOUR
+
+
+def fire_next(root):
+    """Run the earliest scheduled callback now, as if its delay had passed."""
+    _, _, callback, args = heapq.heappop(root._jobs)
+    callback(*args)
+
+
+class FixedDate(date):
+    current = date(2024, 11, 2)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+def test_scheduler_fires_once_after_midnight(zone, monkeypatch):
+    zone("America/Havana")
+    monkeypatch.setattr(rollover, "date", FixedDate)
+    monkeypatch.setattr(rollover.time, "time", lambda: at("2024-11-02T23:30-04:00"))
+    root = Tk()
+    days = []
+    scheduler = RolloverScheduler(root, days.append)
+    scheduler.start()
+
+    due, job, _, _ = root._jobs[0]
+    assert job == scheduler._job
+    assert due - time.monotonic() == pytest.approx(HOUR / 2 + ROLLOVER_GRACE, abs=1)
+
+    # The first of Havana's two midnights changes the date; the second does not
+    monkeypatch.setattr(FixedDate, "current", date(2024, 11, 3))
+    fire_next(root)
+    fire_next(root)
+    assert days == [date(2024, 11, 3)]
+
+    assert len(root.pending()) == 1
+    scheduler.stop()
+    assert root.pending() == []
+
+
+def test_timer_is_capped(zone, monkeypatch):
+    zone("America/New_York")
+    monkeypatch.setattr(rollover.time, "time", lambda: at("2024-06-14T00:00-04:00"))
+    root = Tk()
+    RolloverScheduler(root, lambda day: None).start()
+
+    due = root._jobs[0][0]
+    assert due - time.monotonic() == pytest.approx(MAX_TIMER_DELAY, abs=1)
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from search_index import FormMatch, SearchIndex, WordMatch
+from verb_index import VerbIndex, build_index
+from vocabulary import VocabularyStore
+
+PERSONS = ("1s", "2s", "3s", "1p", "2p", "3p")
+VERBS = {
+    ("hablar", "to speak, to talk"): {
+        "Present": ["hablo", "hablas", "habla", "hablamos", "habláis", "hablan"],
+        "Preterite": ["hablé", "hablaste", "habló", "hablamos", "hablasteis", "hablaron"],
+    },
+    ("tener", "to have"): {
+        "Present": ["tengo", "tienes", "tiene", "tenemos", "tenéis", "tienen"],
+        "Preterite": ["tuve", "tuviste", "tuvo", "tuvimos", "tuvisteis", "tuvieron"],
+    },
+}
+NOUNS = [
+    {"word": "el árbol", "definition": "the tree"},
+    {"word": "la mesa", "definition": "the table"},
+    {"word": "el tren", "definition": "the train"},
+]
+
+
+@pytest.fixture
+def sources(tmp_path):
+    lookup = {
+        infinitive: [
+            dict(zip((f"form_{person}" for person in PERSONS), forms),
+                 infinitive=infinitive, translation=translation, mood="Indicative", tense=tense)
+            for tense, forms in tenses.items()
+        ]
+        for (infinitive, translation), tenses in VERBS.items()
+    }
+    (tmp_path / "lookup.json").write_text(json.dumps(lookup), encoding="utf-8")
+    build_index(str(tmp_path / "lookup.json"), str(tmp_path / "verbs.sqlite3"))
+    (tmp_path / "nouns.json").write_text(json.dumps(NOUNS), encoding="utf-8")
+
+    verbs = VerbIndex(str(tmp_path / "verbs.sqlite3"))
+    vocabulary = VocabularyStore(str(tmp_path / "vocabulary.sqlite3"))
+    vocabulary.add_many([("la casa grande", "the big house")], "pack.csv")
+    yield verbs, vocabulary, str(tmp_path / "nouns.json")
+    verbs.close()
+    vocabulary.close()
+
+
+@pytest.fixture
+def index(tmp_path, sources):
+    verbs, vocabulary, nouns_file = sources
+    index = SearchIndex.open(verbs, vocabulary, str(tmp_path / "search.sqlite3"), nouns_file)
+    yield index
+    index.close()
+
+
+def test_conjugated_form(index):
+    assert index.conjugated("tuvimos") == [
+        FormMatch("tuvimos", "tener", "to have", "Indicative", "Preterite", 3)
+    ]
+    # Accents are optional; "hablamos" is both present and preterite
+    assert [match.form for match in index.conjugated("hablo")] == ["hablo", "habló"]
+    assert [match.form for match in index.conjugated("HABLE")] == ["hablé"]
+    assert {match.tense for match in index.conjugated("hablamos")} == {"Present", "Preterite"}
+    assert index.conjugated("hablaremos") == []
+
+
+def test_spanish_prefix(index):
+    assert index.spanish("ar") == [WordMatch("el árbol", "the tree", "noun")]
+    # Keys drop the leading article, so "el tr" and "tr" find the same words
+    assert [match.spanish for match in index.spanish("el tr")] == ["el tren"]
+    assert [match.spanish for match in index.spanish("t")] == ["tener", "el tren"]
+    assert [match.spanish for match in index.spanish("t", limit=1)] == ["tener"]
+    assert [match.spanish for match in index.spanish("la casa g")] == ["la casa grande"]
+    assert index.spanish("") == []
+
+
+def test_english_gloss(index):
+    # Stop words are ignored, the last token is a prefix
+    assert index.english("to have") == [WordMatch("tener", "to have", "verb")]
+    # Shorter translations first
+    assert [match.spanish for match in index.english("tr")] == ["el árbol", "el tren"]
+    assert [match.spanish for match in index.english("talk")] == ["hablar"]
+    assert [match.spanish for match in index.english("big hou")] == ["la casa grande"]
+    assert index.english("big table") == []
+    assert index.english("the") == []
+
+
+def test_search_puts_forms_first(index):
+    results = index.search("tiene")
+    assert results[0] == FormMatch("tiene", "tener", "to have", "Indicative", "Present", 2)
+    assert results[1:] == []
+    assert [result.spanish for result in index.search("tren")] == ["el tren"]
+    # Spanish prefix matches come before English ones, without duplicates
+    assert [result.spanish for result in index.search("tr")] == ["el tren", "el árbol"]
+    assert [result.spanish for result in index.search("ta")] == ["la mesa", "hablar"]
+    assert len(index.search("t", limit=1)) == 1
+
+
+def test_is_word(index):
+    assert index.is_word("tuvimos")
+    assert index.is_word("la mesa")
+    assert index.is_word("tree")
+    assert not index.is_word("mesas")
+
+
+def test_rebuilds_when_a_source_changes(tmp_path, sources, index):
+    verbs, vocabulary, nouns_file = sources
+    path = str(tmp_path / "search.sqlite3")
+    vocabulary.add_many([("el perro", "the dog")], "more.csv")
+
+    rebuilt = SearchIndex.open(verbs, vocabulary, path, nouns_file)
+    try:
+        assert rebuilt.english("dog") == [WordMatch("el perro", "the dog", "noun")]
+    finally:
+        rebuilt.close()
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+from conftest import SRC_DIR
+from settings_manager import Settings, load_settings
+
+
+def load(tmp_path, raw):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    return load_settings(str(path))
+
+
+def test_int_valued_floats_are_accepted(tmp_path):
+    settings = load(tmp_path, {"conjugation_cache_ttl": 3600.0, "quiz_interval": 90.0})
+    assert settings.conjugation_cache_ttl == 3600
+    assert isinstance(settings.conjugation_cache_ttl, int)
+    assert settings.quiz_interval == 90
+
+
+def test_mistyped_values_fall_back_to_defaults(tmp_path):
+    settings = load(tmp_path, {"quiz_interval": 1.5, "prefetch_size": True, "noun_source": 1})
+    assert settings == Settings()
+
+
+def test_settings_do_not_load_the_data_layer():
+    code = (
+        "import sys, settings_manager; "
+        "print(sorted({'sqlite3', 'requests', 'data_manager', 'prefetch'} & set(sys.modules)))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "[]"
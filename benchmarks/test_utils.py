@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from utils import atomic_replace, atomic_write
+
+
+def test_atomic_write_replaces_the_file(tmp_path):
+    path = str(tmp_path / "state.json")
+    atomic_write(path, '{"a": 1}')
+    atomic_write(path, '{"a": "ñ"}')
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == '{"a": "ñ"}'
+    assert os.listdir(tmp_path) == ["state.json"]
+
+
+def test_failed_build_keeps_the_old_file(tmp_path):
+    path = str(tmp_path / "index.sqlite3")
+    atomic_write(path, "old")
+    with open(path + ".tmp", "w") as f:
+        f.write("left over from an interrupted build")
+
+    with pytest.raises(RuntimeError):
+        with atomic_replace(path) as tmp:
+            assert not os.path.exists(tmp)
+            with open(tmp, "w") as f:
+                f.write("half")
+            raise RuntimeError("build failed")
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "old"
+    assert os.listdir(tmp_path) == ["index.sqlite3"]
@@ -0,0 +1,79 @@
+import pytest
+
+from vocab_import import import_pack
+from vocabulary import VocabularyStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = VocabularyStore(str(tmp_path / "vocabulary.sqlite3"))
+    yield store
+    store.close()
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def entries(store):
+    return [store.word(i) for i in range(len(store))]
+
+
+def test_csv_skips_header_short_and_blank_rows(tmp_path, store):
+    pack = write(
+        tmp_path,
+        "pack.csv",
+        "spanish,english\n"
+        "la mesa,the table\n"
+        "el libro\n"  # one column
+        ",the dog\n"  # no Spanish
+        "el gato,   \n"  # no English
+        '"la casa, grande",the big house\n',
+    )
+    assert import_pack(pack, store) == (2, 2)
+    assert entries(store) == [("la mesa", "the table"), ("la casa, grande", "the big house")]
+
+
+def test_duplicates_are_skipped_within_and_across_packs(tmp_path, store):
+    first = write(tmp_path, "first.tsv", "la mesa\tthe table\nLa  Mesa\tthe desk\n")
+    second = write(tmp_path, "second.csv", "la mesa,a table\nel libro,the book\n")
+
+    assert import_pack(first, store) == (2, 1)
+    assert import_pack(second, store) == (2, 1)
+    # The first spelling and translation stay; ids stay dense
+    assert entries(store) == [("la mesa", "the table"), ("el libro", "the book")]
+    assert len(store) == 2
+
+
+def test_jsonl_skips_malformed_lines(tmp_path, store):
+    pack = write(
+        tmp_path,
+        "pack.jsonl",
+        '{"spanish": "la mesa", "english": "the table"}\n'
+        '{"spanish": "el libro", "english": \n'  # truncated
+        '["el perro", "the dog"]\n'  # not an object
+        '{"spanish": 3, "english": "three"}\n'
+        '\n'
+        '{"word": "el gato", "definition": "the cat"}\n',
+    )
+    assert import_pack(pack, store) == (2, 2)
+    assert entries(store) == [("la mesa", "the table"), ("el gato", "the cat")]
+
+
+def test_anki_export_strips_markup(tmp_path, store):
+    pack = write(
+        tmp_path,
+        "deck.txt",
+        "#separator:tab\n#html:true\n"
+        "<b>el árbol</b>\tthe tree&nbsp;<br>\n"
+        "sin traducción\n",
+    )
+    assert import_pack(pack, store) == (1, 1)
+    assert entries(store) == [("el árbol", "the tree")]
+
+
+def test_unsupported_format(tmp_path, store):
+    with pytest.raises(ValueError):
+        import_pack(write(tmp_path, "pack.xlsx", ""), store)
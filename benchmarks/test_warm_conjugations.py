@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from conftest import read_fixture
+from conjugation_cache import ConjugationCache
+from conjugator import CONJUGATION_MOOD, CONJUGATION_TENSES
+from http_client import HttpClient
+from verb_index import VerbIndex, build_index
+from warm_conjugations import warm
+
+FORMS = {f"form_{person}": "x" for person in ("1s", "2s", "3s", "1p", "2p", "3p")}
+
+
+def entries(infinitive, tenses):
+    return [
+        dict(FORMS, infinitive=infinitive, translation="to x", mood=CONJUGATION_MOOD, tense=tense)
+        for tense in tenses
+    ]
+
+
+@pytest.fixture
+def index(tmp_path):
+    # "hablar" is complete locally; the others only have the present and need fetching
+    source = tmp_path / "lookup.json"
+    source.write_text(
+        json.dumps(
+            {
+                "hablar": entries("hablar", CONJUGATION_TENSES),
+                "abolir": entries("abolir", ["Present"]),
+                "blandir": entries("blandir", ["Present"]),
+                "colorir": entries("colorir", ["Present"]),
+            }
+        ),
+        encoding="utf-8",
+    )
+    build_index(str(source), str(tmp_path / "verbs.sqlite3"))
+    index = VerbIndex(str(tmp_path / "verbs.sqlite3"))
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def conjugation_server(stub_server):
+    page = read_fixture("conjugate_hablar.html")
+    stub_server.routes["/conjugate/abolir"] = lambda handler: (200, {}, page)
+    stub_server.routes["/conjugate/blandir"] = lambda handler: (200, {}, "<html></html>")
+    stub_server.routes["/conjugate/colorir"] = lambda handler: (500, {}, "")
+    return stub_server
+
+
+def run(index, cache, server):
+    http = HttpClient(retries=0, burst=100, rate=100)
+    return warm(index, cache, http, workers=2, url=server.url("/conjugate/{verb}"))
+
+
+def test_warm_fetches_what_the_index_lacks(tmp_path, index, conjugation_server):
+    cache = ConjugationCache(str(tmp_path / "cache.sqlite3"))
+    stats = run(index, cache, conjugation_server)
+
+    assert (stats["local"], stats["cached"], stats["fetched"], stats["not_found"]) == (1, 0, 1, 1)
+    assert stats["failed"] == ["colorir"]
+    assert cache.contains("abolir")
+    assert conjugation_server.hits("/conjugate/hablar") == 0
+
+
+def test_rerun_skips_cached_verbs(tmp_path, index, conjugation_server):
+    cache = ConjugationCache(str(tmp_path / "cache.sqlite3"))
+    run(index, cache, conjugation_server)
+    stats = run(index, cache, conjugation_server)
+
+    assert stats["cached"] == 1
+    assert conjugation_server.hits("/conjugate/abolir") == 1
+    assert conjugation_server.hits("/conjugate/colorir") == 2
+
+
+def test_reserved_capacity_survives_a_smaller_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    warm_cache = ConjugationCache(path, max_entries=2)
+    warm_cache.reserve(5)
+    for i in range(5):
+        warm_cache.put(f"verbo{i}", [["x"]])
+    warm_cache.close()
+
+    app_cache = ConjugationCache(path, max_entries=2)
+    app_cache.put("verbo5", [["x"]])
+    kept = [i for i in range(6) if app_cache.contains(f"verbo{i}")]
+    assert len(kept) == 5 and 5 in kept
@@ -0,0 +1,98 @@
+import re
+import unicodedata
+
+# Senses in definitions like "house, home" or "to run; to manage"
+SENSE_SEPARATORS = re.compile(r"[,;/]|\bor\b")
+PARENTHESES = re.compile(r"\([^)]*\)")
+NON_WORD = re.compile(r"[^\w\s]")
+LEADING_ARTICLES = ("el", "la", "los", "las", "un", "una", "the", "a", "an", "to")
+TILDE = "\u0303"  # Combining mark of ñ, which is a letter of its own ("año" is not "ano")
+
+
+def max_typos(length):
+    """Edit distance still accepted for a variant of this length."""
+    if length < 5:
+        return 0
+    if length <= 6:
+        return 1
+    return 2
+
+
+def normalize(text):
+    """Lowercase, fold accents but keep ñ, strip punctuation and articles."""
+    kept = []
+    for c in unicodedata.normalize("NFKD", text.lower()):
+        if unicodedata.combining(c) and not (c == TILDE and kept and kept[-1] == "n"):
+            continue
+        kept.append(c)
+    text = unicodedata.normalize("NFC", "".join(kept))
+    words = NON_WORD.sub(" ", text).split()
+    if len(words) > 1 and words[0] in LEADING_ARTICLES:
+        words = words[1:]
+    return " ".join(words)
+
+
+def search_key(text):
+    """normalize() with ñ folded too, for lookups where accents are optional."""
+    return normalize(text).replace("ñ", "n")
+
+
+def accepted_answers(answer):
+    """
+    Normalized variants accepted for an answer: the whole text plus each sense,
+    with and without parenthesised notes. Computed once per word when it starts
+    being reviewed (see review_scheduler), not per answer.
+    """
+    variants = set()
+    for text in (answer, PARENTHESES.sub(" ", answer)):
+        variants.add(normalize(text))
+        variants.update(normalize(sense) for sense in SENSE_SEPARATORS.split(text))
+    variants.discard("")
+    return frozenset(variants)
+
+
+def within_distance(a, b, limit):
+    """Levenshtein distance <= limit, only filling the diagonal band of width limit."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    if limit == 0:
+        return a == b
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        lo, hi = max(1, i - limit), min(len(b), i + limit)
+        current = [limit + 1] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(lo, hi + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] != b[j - 1]),
+            )
+        if min(current[lo - 1 : hi + 1]) > limit:
+            return False
+        previous = current
+    return previous[len(b)] <= limit
+
+
+def is_correct(user_answer, variants, is_known_word=None):
+    """
+    Match a typed answer against accepted_answers(); exact hits are a set lookup.
+    is_known_word: optional predicate on the normalized answer. A near miss that is
+    itself a known word ("perro" for "pero") is a different word, not a typo. The
+    predicate folds ñ, so the expected word typed without it ("montana") is not one.
+    """
+    guess = normalize(user_answer)
+    if not guess:
+        return False
+    if guess in variants:
+        return True
+    if (
+        is_known_word is not None
+        and search_key(guess) not in {variant.replace("ñ", "n") for variant in variants}
+        and is_known_word(guess)
+    ):
+        return False
+    return any(
+        within_distance(guess, variant, max_typos(len(variant))) for variant in variants
+    )
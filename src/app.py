@@ -1,11 +1,17 @@
-import tkinter as tk
-import ctypes
 from data_manager import DailyDataManager
-from quiz import QuizDialog
-from tray import TrayController
+from fetch_pipeline import DataFetcher
+from prefetch import Prefetcher, PrefetchQueue
+from rollover import RolloverScheduler
+from platform_backend import get_backend
+from paths import SETTINGS_FILE, PREFETCH_FILE, in_data_dir
+from profiles import active_profile, set_active_profile, profile_dir, migrate_to_profiles
 from logger import logger
 from datetime import date
-from settings_manager import load_settings
+import threading
+import time
+from settings_manager import SettingsService
+from metrics import metrics, timed, incr
+from utils import MS_IN_SECOND
 
 
 # === COLORS ===
@@ -52,33 +58,331 @@ CONJUGATION_HEADER_FONT = (FONT_NAME, HEADER_SIZE, "bold")
 CONJUGATION_CELLS_FONT = (FONT_NAME, CELL_SIZE)
 
 # === QUIZ ===
-MS_IN_SECOND = 1000
+MAX_QUIZ_DELAY = 24 * 60 * 60  # In seconds, longer waits re-arm the timer
+FETCH_RETRY_MIN = 5  # In seconds, first retry after a failed fetch
+FETCH_RETRY_MAX = 5 * 60  # In seconds, retries back off up to this
 
 # === WINDOW ===
 WINDOW_OFFSET_X = -30  # manual adjustment for right margin
 
+MAX_CONJUGATION_ROWS = 10
+
+
+class InfoSection:
+    """Titled frame with two lines of content. Built once; set() only touches changed labels."""
+
+    def __init__(self, parent, tk):
+        """tk: the widget set from the platform backend (tkinter or headless_tk)."""
+        self.frame = tk.Frame(
+            parent,
+            bg=FRAME_COLOR,
+            bd=FRAME_BORDER_WIDTH,
+            relief=FRAME_RELIEF,
+            padx=FRAME_PADX,
+            pady=FRAME_PADY,
+        )
+        title = tk.Label(self.frame, font=TITLE_FONT, bg=FRAME_COLOR, fg=TEXT_COLOR)
+        title.pack(anchor="w")
+        tk.Frame(self.frame, height=SEPARATOR_HEIGHT, bg=SEPARATOR_COLOR).pack(
+            fill="x", pady=SEPARATOR_PADY
+        )
+        top = tk.Label(self.frame, font=SUBTITLE_FONT, bg=FRAME_COLOR, fg=TEXT_COLOR)
+        top.pack(anchor="w")
+        tk.Frame(self.frame, height=SEPARATOR_HEIGHT, bg=SEPARATOR_COLOR).pack(
+            fill="x", pady=SEPARATOR_PADY
+        )
+        bottom = tk.Label(
+            self.frame, font=CONTENT_FONT, bg=FRAME_COLOR, fg=TEXT_COLOR
+        )
+        bottom.pack(anchor="w")
+
+        self._labels = (title, top, bottom)
+        self._texts = [None] * len(self._labels)
+
+    def set(self, title, content_top, content_bottom):
+        for i, text in enumerate((title, content_top, content_bottom)):
+            if self._texts[i] != text:
+                self._labels[i].config(text=text)
+                self._texts[i] = text
+
+    def pack(self):
+        self.frame.pack(fill="x", padx=SECTION_PADX, pady=SECTION_PADY)
+
+    def hide(self):
+        self.frame.pack_forget()
+
+
+class ConjugationTable:
+    """
+    Grid of conjugation cells kept across refreshes. set() rewrites only the
+    cells whose text changed and adds or destroys labels only when the table
+    shape changes.
+    """
+
+    def __init__(self, parent, tk):
+        self._tk = tk
+        self.frame = tk.Frame(
+            parent,
+            bg=BG_COLOR,
+            bd=FRAME_BORDER_WIDTH,
+            relief=FRAME_RELIEF,
+            padx=FRAME_PADX,
+            pady=FRAME_PADY,
+        )
+        self._header = tk.Label(
+            self.frame,
+            text="Conjugation",
+            font=CONJUGATION_HEADER_FONT,
+            bg=BG_COLOR,
+            fg=TEXT_COLOR,
+        )
+        self._header.grid(row=0, column=0, pady=(0, SECTION_PADY))
+        # Shared named fonts: Tk resolves each once, cells only hold a reference
+        self._cell_font = tk.Font(self.frame, font=CONJUGATION_CELLS_FONT)
+        self._highlight_font = tk.Font(
+            self.frame, family=FONT_NAME, size=CELL_SIZE, weight="bold"
+        )
+        self._columns = 0
+        self.row_widgets = []
+        self._texts = []
+        self.active_col = None
+
+    def set(self, conjugation):
+        rows = conjugation[:MAX_CONJUGATION_ROWS]
+        if self.active_col is not None:
+            self.highlight_column(self.active_col)  # toggles it off
+
+        for i, row in enumerate(rows):
+            if i == len(self.row_widgets):
+                self.row_widgets.append([])
+                self._texts.append([])
+            labels, texts = self.row_widgets[i], self._texts[i]
+            for j, cell in enumerate(row):
+                if j == len(labels):
+                    labels.append(self._new_cell(i, j, cell))
+                    texts.append(cell)
+                elif texts[j] != cell:
+                    labels[j].config(text=cell)
+                    texts[j] = cell
+            for label in labels[len(row):]:
+                label.destroy()
+            del labels[len(row):], texts[len(row):]
+
+        for labels in self.row_widgets[len(rows):]:
+            for label in labels:
+                label.destroy()
+        del self.row_widgets[len(rows):], self._texts[len(rows):]
+
+        self._set_columns(len(conjugation[0]))
+
+    def _new_cell(self, i, j, text):
+        label = self._tk.Label(
+            self.frame,
+            text=text,
+            font=self._cell_font,
+            bg=BG_COLOR,
+            fg=TEXT_COLOR,
+            borderwidth=CELL_BORDER_WIDTH,
+            relief=CELL_RELIEF,
+            padx=CELL_PADX,
+            pady=CELL_PADY,
+            width=CELL_WIDTH,
+        )
+        label.grid(row=i + 1, column=j, sticky="nsew")
+        label.bind("<Button-1>", lambda e, c=j: self.highlight_column(c))
+        return label
+
+    def _set_columns(self, columns):
+        if columns == self._columns:
+            return
+        for j in range(self._columns, columns):
+            self.frame.grid_columnconfigure(j, weight=1)
+        for j in range(columns, self._columns):
+            self.frame.grid_columnconfigure(j, weight=0)
+        self._header.grid_configure(columnspan=columns)
+        self._columns = columns
+
+    def highlight_column(self, col_index):
+        """Toggle highlight for the clicked column, restyling only the columns that change."""
+        previous = self.active_col
+        self.active_col = None if previous == col_index else col_index
+        if previous is not None:
+            self._style_column(previous, highlighted=False)
+        if self.active_col is not None:
+            self._style_column(self.active_col, highlighted=True)
+
+    def _style_column(self, col_index, highlighted):
+        bg = HIGHLIGHTED_CELL_COLOR if highlighted else BG_COLOR
+        font = self._highlight_font if highlighted else self._cell_font
+        for row in self.row_widgets:
+            if col_index < len(row):
+                row[col_index].config(bg=bg, font=font)
+
+    def pack(self):
+        self.frame.pack(fill="x", padx=SECTION_PADX, pady=SECTION_PADY)
+
+    def hide(self):
+        self.frame.pack_forget()
+
+
+class DailyView:
+    """The widget's content: noun and verb sections plus the conjugation table."""
+
+    def __init__(self, parent, tk):
+        self.noun = InfoSection(parent, tk)
+        self.verb = InfoSection(parent, tk)
+        self.conjugation = ConjugationTable(parent, tk)
+        self.noun.pack()
+        self._full = False  # verb and conjugation sections are packed
+
+    def show_loading(self):
+        self.noun.set("Loading", "...", "Fetching today's words")
+        if self._full:
+            self.verb.hide()
+            self.conjugation.hide()
+            self._full = False
+
+    def show_error(self, retry_in):
+        self.noun.set("Error", "...", f"Could not fetch today's words, retrying in {retry_in} s")
+        if self._full:
+            self.verb.hide()
+            self.conjugation.hide()
+            self._full = False
+
+    def show(self, data):
+        self.noun.set(
+            "Random noun", data["noun"]["spanish"].upper(), data["noun"]["english"]
+        )
+        self.verb.set(
+            "Random verb", data["verb"]["spanish"].upper(), data["verb"]["english"]
+        )
+        self.conjugation.set(data["conjugation"])
+        if not self._full:
+            self.verb.pack()
+            self.conjugation.pack()
+            self._full = True
+
 
 class SpanishWidgetApp:
-    def __init__(self):
+    def __init__(self, profile=None, backend=None, data_dir=None):
+        """
+        profile: optional StartupProfile; each startup phase is marked on it and
+        the app reports and quits once the tray is up.
+        backend: platform backend for window tweaks and the tray (detected if None).
+        data_dir: where profiles and shared caches live (data/ if None).
+        """
         logger.info("Starting the app")
-        self.manager = DailyDataManager()
-        self.root = tk.Tk()
+        self.profile = profile
+        self.backend = backend or get_backend()
+        self.data_dir = data_dir
+        migrate_to_profiles(data_dir)
+        self.profile_name = active_profile(data_dir)
+        profile_path = profile_dir(self.profile_name, data_dir)
+        logger.info("Active profile: %s", self.profile_name)
+        self._open_settings(profile_path)
+        settings = self.settings.current
+        metrics.enabled = settings.metrics_enabled
+        self._mark("settings")
+        self.manager = DailyDataManager(
+            cache_ttl=settings.conjugation_cache_ttl,
+            cache_size=settings.conjugation_cache_size,
+            noun_source=settings.noun_source,
+            data_dir=data_dir,
+            profile_dir=profile_path,
+        )
+        self._mark("history load")
+        self.widgets = self.backend.widgets()
+        self.root = self.widgets.Tk()
         self._configure_root()
+        self._mark("window")
 
-        # Quiz settings
-        settings = load_settings()
-        self.quiz_enabled = settings["quiz_enabled"]
-        self.quiz_interval = settings["quiz_interval"]
         self._quiz_job = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_queued = False
+        self._last_quiz = time.time()
 
-        logger.info(f"Config values: {settings}")
-        self.tray = TrayController(self)
-        self.tray.start()
+        logger.info("Config values: %s", settings)
+        self.fetcher = DataFetcher(
+            self.root, self.manager, self._on_data_generated, on_error=self._on_data_failed
+        )
+        self._retry_job = None
+        self._retry_delay = FETCH_RETRY_MIN
+        self.prefetcher = Prefetcher(
+            self.root,
+            self.manager,
+            size=settings.prefetch_size,
+            queue=PrefetchQueue(in_data_dir(PREFETCH_FILE, profile_path)),
+        )
+        self.rollover = RolloverScheduler(self.root, self._on_rollover)
+        self.tray = None
 
         # Load data
-        data = self._load_today_data()
-        self.display_data(data)
-        self.schedule_quiz(data["noun"])
+        self._show_today()
+        self.root.update_idletasks()
+        self._mark("first paint")
+
+        # Everything below waits until the widget is on screen
+        self.root.after_idle(self._start_background)
+
+    def _start_background(self):
+        self.tray = self.backend.create_tray(self)
+        self.tray.start()
+        self._mark("tray start")
+
+        if self.profile:
+            self.profile.report()
+            self.quit()
+            return
+        self.prefetcher.start()
+        self.rollover.start()
+        metrics.start_exporter()
+        self.manager.sync_reviews()
+        # Quiz answers are checked against the search index without waiting for it
+        self.fetcher.submit(self.manager.warm_search_index)
+        self.schedule_quiz()
+
+    def _open_settings(self, profile_path):
+        self.settings = SettingsService(in_data_dir(SETTINGS_FILE, profile_path))
+        self.settings.subscribe(
+            lambda changed: self.schedule_quiz(), keys=("quiz_enabled", "quiz_interval")
+        )
+
+    # === Profiles ===
+    def switch_profile(self, name):
+        """
+        Make another profile active (created if new). Only that profile's
+        settings, history, reviews and prefetch queue are opened; the window,
+        verb index and shared caches stay as they are.
+        """
+        if name == self.profile_name:
+            return
+        profile_path = profile_dir(name, self.data_dir)
+        logger.info("Switching profile from %s to %s", self.profile_name, name)
+        self.fetcher.cancel()
+        self._cancel_retry()
+        self._retry_delay = FETCH_RETRY_MIN
+        self.prefetcher.stop()
+        self.settings.flush()
+
+        set_active_profile(name, self.data_dir)
+        self.profile_name = name
+        self._open_settings(profile_path)
+        settings = self.settings.current
+        metrics.enabled = settings.metrics_enabled
+        self.manager.noun_source = settings.noun_source
+        self.manager.open_profile(profile_path)
+        self.prefetcher.size = settings.prefetch_size
+        self.prefetcher.queue = PrefetchQueue(in_data_dir(PREFETCH_FILE, profile_path))
+        self._last_quiz = time.time()
+
+        self._show_today()
+        self.prefetcher.start()
+        self.manager.sync_reviews()
+        self.schedule_quiz()
+
+    def _mark(self, phase):
+        if self.profile:
+            self.profile.mark(phase)
 
     # === Root window setup ===
     def _configure_root(self):
@@ -91,172 +395,160 @@ class SpanishWidgetApp:
         y = WINDOW_MARGIN
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
 
-        self.main_frame = tk.Frame(self.root, bg=WINDOW_BG_COLOR)
+        self.main_frame = self.widgets.Frame(self.root, bg=WINDOW_BG_COLOR)
         self.main_frame.pack(padx=FRAME_PADX, pady=FRAME_PADY)
+        self.view = DailyView(self.main_frame, self.widgets)
 
-        # Make window click-through (Windows only)
-        hwnd = ctypes.windll.user32.FindWindowW(None, self.root.title())
-        ctypes.windll.user32.SetWindowLongW(hwnd, -20, 0x80000 | 0x20)
-        self.root.attributes("-transparentcolor", WINDOW_BG_COLOR)
-        self.root.attributes("-topmost", False)
-
-    def _generate_data(self):
-        noun = self.manager.random_noun()
-        verb = self.manager.random_verb()
-        conj = self.manager.conjugation(verb.spanish)
-        return  {"noun": noun.__dict__, "verb": verb.__dict__, "conjugation": conj}
+        # Click-through and transparent background where the platform supports it
+        self.backend.configure_window(self.root, WINDOW_BG_COLOR)
 
     # === Data loading ===
     def _load_today_data(self):
-        logger.info(f"Checking if there is an entry for {str(date.today())}")
+        logger.info("Checking if there is an entry for %s", date.today())
         data = self.manager.get_today()
         if data:
-            logger.info(f"Data found: noun {data['noun']}, verb: {data['verb']}")
+            logger.info("Data found: noun %s, verb: %s", data["noun"], data["verb"])
             return data
 
         logger.info("Data not found, generating new")
-        generated_data = self._generate_data()
-        self.manager.save_today(generated_data['noun'], generated_data['verb'], generated_data['conjugation'])
-        return generated_data
+        self.regenerate_data_for_today()
+        return None
+
+    def request_refresh(self):
+        """
+        Refresh from any thread (the tray runs its own). Clicks arriving before
+        the queued refresh runs collapse into it.
+        """
+        with self._refresh_lock:
+            if self._refresh_queued:
+                incr("refresh_coalesced")
+                return
+            self._refresh_queued = True
+        self.root.after(0, self._run_refresh)
+
+    def _run_refresh(self):
+        with self._refresh_lock:
+            self._refresh_queued = False
+        self.regenerate_data_for_today()
+
+    def _show_today(self):
+        """Display today's saved entry, or start getting one (prefetched or fetched)."""
+        data = self._load_today_data()
+        if data:
+            self.display_data(data)
+
+    def _on_rollover(self, day):
+        # The saved entry for the new day, else a prefetched bundle or a background fetch
+        self._show_today()
 
     def regenerate_data_for_today(self):
-        generated_data = self._generate_data()
+        """Show the next prefetched bundle, or generate one in the background if none is ready."""
+        self._cancel_retry()
+        if self.fetcher.in_flight:
+            self.fetcher.request()  # joins the refresh already running
+            return
+        bundle = self.prefetcher.pop()
+        if bundle:
+            self._on_data_generated(bundle)
+            return
+
+        self.display_loading()
+        self.fetcher.request()
+
+    def _on_data_failed(self, error):
+        """Show the failure and try again, doubling the wait up to FETCH_RETRY_MAX."""
+        delay = self._retry_delay
+        self._retry_delay = min(delay * 2, FETCH_RETRY_MAX)
+        self.view.show_error(delay)
+        self._cancel_retry()
+        self._retry_job = self.root.after(delay * MS_IN_SECOND, self._retry_fetch)
+
+    def _retry_fetch(self):
+        self._retry_job = None
+        self.regenerate_data_for_today()
+
+    def _cancel_retry(self):
+        if self._retry_job:
+            self.root.after_cancel(self._retry_job)
+            self._retry_job = None
+
+    def _on_data_generated(self, generated_data):
+        self._cancel_retry()
+        self._retry_delay = FETCH_RETRY_MIN
         self.manager.save_today(generated_data['noun'], generated_data['verb'], generated_data['conjugation'])
 
         self.display_data(generated_data)
-        self.schedule_quiz(generated_data["noun"])
+        self.schedule_quiz()
 
     # === Display ===
-    def display_data(self, data):
-        for w in self.main_frame.winfo_children():
-            w.destroy()
-
-        self._build_frame(
-            "Random noun", data["noun"]["spanish"].upper(), data["noun"]["english"]
-        )
-        self._build_frame(
-            "Random verb", data["verb"]["spanish"].upper(), data["verb"]["english"]
-        )
-        self._build_conjugation_table(data["conjugation"])
-
-    def _build_frame(self, title, content_top, content_bottom):
-        f = tk.Frame(
-            self.main_frame,
-            bg=FRAME_COLOR,
-            bd=FRAME_BORDER_WIDTH,
-            relief=FRAME_RELIEF,
-            padx=FRAME_PADX,
-            pady=FRAME_PADY,
-        )
-        tk.Label(f, text=title, font=TITLE_FONT, bg=FRAME_COLOR, fg=TEXT_COLOR).pack(
-            anchor="w"
-        )
-        tk.Frame(f, height=SEPARATOR_HEIGHT, bg=SEPARATOR_COLOR).pack(
-            fill="x", pady=SEPARATOR_PADY
-        )
-        tk.Label(
-            f, text=content_top, font=SUBTITLE_FONT, bg=FRAME_COLOR, fg=TEXT_COLOR
-        ).pack(anchor="w")
-        tk.Frame(f, height=SEPARATOR_HEIGHT, bg=SEPARATOR_COLOR).pack(
-            fill="x", pady=SEPARATOR_PADY
-        )
-        tk.Label(
-            f, text=content_bottom, font=CONTENT_FONT, bg=FRAME_COLOR, fg=TEXT_COLOR
-        ).pack(anchor="w")
-        f.pack(fill="x", padx=SECTION_PADX, pady=SECTION_PADY)
-
-    def _build_conjugation_table(self, conjugation):
-        conj_frame = tk.Frame(
-            self.main_frame,
-            bg=BG_COLOR,
-            bd=FRAME_BORDER_WIDTH,
-            relief=FRAME_RELIEF,
-            padx=FRAME_PADX,
-            pady=FRAME_PADY,
-        )
-        tk.Label(
-            conj_frame,
-            text="Conjugation",
-            font=CONJUGATION_HEADER_FONT,
-            bg=BG_COLOR,
-            fg=TEXT_COLOR,
-        ).grid(row=0, column=0, columnspan=len(conjugation[0]), pady=(0, SECTION_PADY))
-
-        self.row_widgets = []
-        self.active_col = None
-
-        for i, row in enumerate(conjugation[:10]):
-            row_labels = []
-            for j, cell in enumerate(row):
-                label = tk.Label(
-                    conj_frame,
-                    text=cell,
-                    font=CONJUGATION_CELLS_FONT,
-                    bg=BG_COLOR,
-                    fg=TEXT_COLOR,
-                    borderwidth=CELL_BORDER_WIDTH,
-                    relief=CELL_RELIEF,
-                    padx=CELL_PADX,
-                    pady=CELL_PADY,
-                    width=CELL_WIDTH,
-                )
-                label.grid(row=i + 1, column=j, sticky="nsew")
-                conj_frame.grid_columnconfigure(j, weight=1)
-
-                label.bind("<Button-1>", lambda e, c=j: self.highlight_column(c))
-                row_labels.append(label)
-            self.row_widgets.append(row_labels)
-
-        conj_frame.pack(fill="x", padx=SECTION_PADX, pady=SECTION_PADY)
-
-    # === Highlighting ===
-    def highlight_column(self, col_index):
-        """Toggle highlight for the clicked column."""
-        if self.active_col == col_index:
-            for row in self.row_widgets:
-                for label in row:
-                    label.config(bg=BG_COLOR, font=CONJUGATION_CELLS_FONT)
-            self.active_col = None
-            return
-
-        for row in self.row_widgets:
-            for j, label in enumerate(row):
-                if j == col_index:
-                    label.config(
-                        bg=HIGHLIGHTED_CELL_COLOR,
-                        font=(FONT_NAME, CELL_SIZE, "bold"),
-                    )
-                else:
-                    label.config(bg=BG_COLOR, font=CONJUGATION_CELLS_FONT)
+    def display_loading(self):
+        self.view.show_loading()
 
-        self.active_col = col_index
+    @timed("display_data")
+    def display_data(self, data):
+        self.view.show(data)
 
     # === Quiz ===
-    def schedule_quiz(self, noun):
+    def schedule_quiz(self):
+        """
+        Arm one timer for the review due soonest, never sooner than quiz_interval
+        after the previous quiz.
+        """
         if self._quiz_job:
             self.root.after_cancel(self._quiz_job)
             self._quiz_job = None
         if not self.quiz_enabled:
             return
+        item = self.manager.reviews.peek()
+        if item is None:
+            return
+        now = time.time()
+        delay = max(item.due_at - now, self._last_quiz + self.quiz_interval - now, 0)
         self._quiz_job = self.root.after(
-            self.quiz_interval * MS_IN_SECOND,
-            lambda: (QuizDialog(self.root, noun), self.schedule_quiz(noun)),
+            int(min(delay, MAX_QUIZ_DELAY) * MS_IN_SECOND), self._show_quiz
         )
 
+    def _show_quiz(self):
+        self._quiz_job = None
+        self.rollover.check()  # a wake-up past midnight shows the new day before quizzing
+        item = self.manager.reviews.peek()
+        if item and item.due_at <= time.time():
+            self._last_quiz = time.time()
+            self.widgets.QuizDialog(
+                self.root,
+                {"spanish": item.spanish, "english": item.english},
+                on_answer=lambda correct: self._on_quiz_answer(item.spanish, correct),
+                is_known_word=self.manager.is_known_word,
+                variants=item.variants,
+            )
+        self.schedule_quiz()
+
+    def _on_quiz_answer(self, spanish, correct):
+        self.manager.reviews.record(spanish, correct)
+        self.schedule_quiz()
+
+    @property
+    def quiz_enabled(self):
+        return self.settings.current.quiz_enabled
+
+    @property
+    def quiz_interval(self):
+        return self.settings.current.quiz_interval
+
     def set_quiz_enabled(self, enabled: bool):
-        self.quiz_enabled = enabled
-        today = self.manager.get_today()
-        if today:
-            self.schedule_quiz(today["noun"])
+        self.settings.update(quiz_enabled=enabled)  # subscriber re-arms the quiz
 
     def set_quiz_interval(self, seconds: int):
-        self.quiz_interval = seconds
-        today = self.manager.get_today()
-        if today:
-            self.schedule_quiz(today["noun"])
+        self.settings.update(quiz_interval=seconds)
 
     # === Lifecycle ===
     def quit(self):
+        self._cancel_retry()
+        self.rollover.stop()
+        self.prefetcher.stop()
+        self.fetcher.shutdown()
+        metrics.stop_exporter()
+        self.settings.flush()
         self.root.quit()
         self.root.destroy()
 
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from paths import CONJUGATION_CACHE_FILE
+from logger import logger
+from metrics import incr
+from defaults import DEFAULT_CACHE_TTL, DEFAULT_CACHE_SIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conjugations (
+    key TEXT PRIMARY KEY,
+    verb TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conjugations_used_at ON conjugations (used_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def cache_key(verb: str) -> str:
+    return hashlib.sha256(verb.strip().lower().encode("utf-8")).hexdigest()
+
+
+class ConjugationCache:
+    """
+    On-disk conjugation tables keyed by infinitive, with TTL expiry and LRU eviction.
+    Eviction keeps max_entries, or the capacity reserved in the file if that is larger.
+    """
+
+    def __init__(
+        self, path=CONJUGATION_CACHE_FILE, ttl=DEFAULT_CACHE_TTL, max_entries=DEFAULT_CACHE_SIZE
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def get(self, verb: str):
+        key = cache_key(verb)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, stored_at FROM conjugations WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM conjugations WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._conn.execute(
+                    "UPDATE conjugations SET used_at = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+            hits, misses = self.hits, self.misses
+        incr("conjugation_cache_hit" if row else "conjugation_cache_miss")
+
+        logger.info(
+            "Conjugation cache %s for %s (hits: %d, misses: %d)",
+            "hit" if row else "miss",
+            verb,
+            hits,
+            misses,
+        )
+        return json.loads(row[0]) if row else None
+
+    def contains(self, verb: str) -> bool:
+        """Whether a fresh entry exists, without touching recency or hit counters."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at FROM conjugations WHERE key = ?", (cache_key(verb),)
+            ).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl
+
+    def reserve(self, entries: int):
+        """
+        Keep room for at least `entries` tables in this file, for every process that
+        opens it (the warm-up CLI reserves the whole verb list, the app keeps it).
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('reserved', ?)", (str(entries),)
+            )
+            self._conn.commit()
+
+    def _capacity(self):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'reserved'").fetchone()
+        return max(self.max_entries, int(row[0])) if row else self.max_entries
+
+    def put(self, verb: str, table):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conjugations VALUES (?, ?, ?, ?, ?)",
+                (cache_key(verb), verb, json.dumps(table, ensure_ascii=False), now, now),
+            )
+            evicted = self._conn.execute(
+                "DELETE FROM conjugations WHERE key IN ("
+                "SELECT key FROM conjugations ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self._capacity(),),
+            ).rowcount
+            self._conn.commit()
+        if evicted:
+            logger.info("Conjugation cache evicted %d least recently used entries", evicted)
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,60 @@
+import re
+from html import unescape
+
+TABLE_OPEN = re.compile(r"<table\b", re.IGNORECASE)
+TABLE_CLOSE = re.compile(r"</table\s*>", re.IGNORECASE)
+ROW = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.IGNORECASE | re.DOTALL)
+CELL = re.compile(r"<t([dh])\b[^>]*>(.*?)</t\1\s*>", re.IGNORECASE | re.DOTALL)
+TAG = re.compile(r"<[^>]*>")
+# Row labels every conjugation table has; its class name is obfuscated and changes
+REQUIRED_PERSONS = ("yo", "nosotros")
+# Case-insensitive search instead of lower(), which copies the fragment through a wide buffer
+PERSON_PATTERNS = [re.compile(re.escape(person), re.IGNORECASE) for person in REQUIRED_PERSONS]
+MIN_ROWS = 4
+
+
+def table_fragments(html):
+    """Yield each <table>...</table> slice of the page, without parsing anything else."""
+    pos = 0
+    while True:
+        start = TABLE_OPEN.search(html, pos)
+        if not start:
+            return
+        end = TABLE_CLOSE.search(html, start.end())
+        if not end:
+            return
+        yield html[start.start() : end.end()]
+        pos = end.end()
+
+
+def cell_text(cell):
+    """Text of a cell with its markup dropped, each text run stripped as a browser would show it."""
+    return "".join(unescape(text).strip() for text in TAG.split(cell))
+
+
+def parse_table(fragment):
+    """Rows of th/td texts of one table fragment; rows without cells are left out."""
+    rows = (
+        [cell_text(cell) for _, cell in CELL.findall(row)] for row in ROW.findall(fragment)
+    )
+    return [row for row in rows if row]
+
+
+def is_conjugation_table(rows):
+    labels = {row[0].lower() for row in rows}
+    return len(rows) >= MIN_ROWS and all(person in labels for person in REQUIRED_PERSONS)
+
+
+def extract_conjugation_table(html):
+    """
+    Find the conjugation table in a conjugation page by its shape (person labels
+    in the first column) and return it as rows of cell texts, or None.
+    Only table fragments that mention every required person get parsed.
+    """
+    for fragment in table_fragments(html):
+        if not all(pattern.search(fragment) for pattern in PERSON_PATTERNS):
+            continue
+        rows = parse_table(fragment)
+        if is_conjugation_table(rows):
+            return rows
+    return None
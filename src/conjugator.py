@@ -0,0 +1,23 @@
+from verb_index import VerbIndex
+
+# Same layout as the spanishdict.com indicative table the widget was built around
+CONJUGATION_MOOD = "Indicative"
+CONJUGATION_TENSES = ("Present", "Preterite", "Imperfect", "Conditional", "Future")
+PERSON_LABELS = ("yo", "tú", "él/ella/Ud.", "nosotros", "vosotros", "ellos/ellas/Uds.")
+
+
+def conjugation_table(index: VerbIndex, verb: str):
+    """
+    Build the header + one-row-per-person table from the local verb index.
+    Returns None when the verb (or any displayed tense) is not in the index.
+    """
+    forms = index.forms(verb, CONJUGATION_MOOD)
+    if not all(tense in forms for tense in CONJUGATION_TENSES):
+        return None
+
+    table = [[""] + list(CONJUGATION_TENSES)]
+    for person, label in enumerate(PERSON_LABELS):
+        table.append(
+            [label] + [forms[tense][person] or "-" for tense in CONJUGATION_TENSES]
+        )
+    return table
@@ -1,10 +1,34 @@
-import os, json, requests, random
-from bs4 import BeautifulSoup
+import json
+import threading
 from dataclasses import dataclass
 from datetime import date
-from paths import LOOKUP_FILE, HISTORY_FILE, FALLBACK_NOUNS_FILE
+from paths import (
+    FALLBACK_NOUNS_FILE,
+    HISTORY_FILE,
+    HISTORY_DB_FILE,
+    REVIEWS_FILE,
+    DRAW_POOLS_FILE,
+    VOCABULARY_FILE,
+    CONJUGATION_CACHE_FILE,
+    SEARCH_INDEX_FILE,
+    in_data_dir,
+)
 from logger import logger
-import time
+from verb_index import VerbIndex
+from conjugator import conjugation_table
+from conjugation_extract import extract_conjugation_table
+from conjugation_cache import ConjugationCache
+from defaults import DEFAULT_CACHE_TTL, DEFAULT_CACHE_SIZE, DEFAULT_NOUN_SOURCE
+from history_store import HistoryStore
+from review_scheduler import ReviewScheduler
+from draw_pool import DrawPools
+from vocabulary import VocabularyStore
+from search_index import SearchIndex, DEFAULT_LIMIT
+from single_flight import SingleFlight
+from metrics import timed, incr
+
+
+CONJUGATION_URL = "https://www.spanishdict.com/conjugate/{verb}"
 
 
 @dataclass
@@ -25,98 +49,268 @@ def load_fallback_words():
         return json.load(f)
 
 
-def get_fallback_word():
-    words = load_fallback_words()
-    entry = random.choice(words)
-    return NounData(spanish=entry["word"], english=entry["definition"])
+def scrape_conjugation(http, verb: str, url=CONJUGATION_URL):
+    """Fetch the conjugation page and extract its table; None if there is none, raises on HTTP errors."""
+    resp = http.get(url.format(verb=verb))
+    resp.raise_for_status()
+    return extract_conjugation_table(resp.text)
+
+
+def load_verb_index():
+    try:
+        return VerbIndex.open()
+    except Exception as e:
+        logger.error("Verb index unavailable: %s", e)
+        return None
 
 
 class DailyDataManager:
-    def __init__(self):
-        self.history = self._load_history()
+    def __init__(
+        self,
+        cache_ttl=DEFAULT_CACHE_TTL,
+        cache_size=DEFAULT_CACHE_SIZE,
+        noun_source=DEFAULT_NOUN_SOURCE,
+        data_dir=None,
+        profile_dir=None,
+    ):
+        """
+        data_dir: keep the shared stores there instead of data/ (None for the default).
+        profile_dir: where the learner's history, reviews and draw pools live (data_dir if None).
+        """
+        self.history = self.reviews = self.draws = None
+        self.open_profile(profile_dir or data_dir)
+        self._fallback_words = None
+        self.vocabulary = VocabularyStore(in_data_dir(VOCABULARY_FILE, data_dir))
+        self.noun_source = noun_source
+        self.verbs = load_verb_index()
+        self.conjugation_cache = ConjugationCache(
+            in_data_dir(CONJUGATION_CACHE_FILE, data_dir), ttl=cache_ttl, max_entries=cache_size
+        )
+        self._search_path = in_data_dir(SEARCH_INDEX_FILE, data_dir)
+        self._search = None
+        self._search_lock = threading.Lock()
+        self._flights = SingleFlight()
+        self._http = None
+        self.online = True  # Whether the last noun API call got an answer
 
-    # --- History ---
-    def _load_history(self):
-        if os.path.exists(HISTORY_FILE):
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+    def open_profile(self, profile_dir):
+        """
+        Point the per-learner stores at another profile and close the previous ones.
+        Nothing else is reloaded. Callers make in-flight work stale first; a worker
+        still inside a closed store fails and its result is discarded.
+        """
+        previous = (self.history, self.reviews, self.draws)
+        self.history = HistoryStore(
+            in_data_dir(HISTORY_DB_FILE, profile_dir), in_data_dir(HISTORY_FILE, profile_dir)
+        )
+        self.reviews = ReviewScheduler(in_data_dir(REVIEWS_FILE, profile_dir))
+        self.draws = DrawPools(in_data_dir(DRAW_POOLS_FILE, profile_dir))
+        for store in previous:
+            if store is not None:
+                store.close()
+
+    @property
+    def http(self):
+        # http_client pulls in requests/urllib3, only pay for it on the first fetch
+        if self._http is None:
+            from http_client import get_client
+
+            self._http = get_client()
+        return self._http
+
+    @property
+    def search_index(self):
+        # Opened on first use; the first build after a source change takes a few seconds
+        with self._search_lock:
+            if self._search is None:
+                self._search = SearchIndex.open(
+                    self.verbs, self.vocabulary, path=self._search_path
+                )
+            return self._search
+
+    # --- Search ---
+    @timed("search")
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """FormMatch/WordMatch results for a conjugated form, Spanish prefix or English gloss."""
+        return self.search_index.search(query, limit)
+
+    def lookup_form(self, form):
+        """Which infinitive, mood, tense and person a conjugated form is ("tuvimos")."""
+        return self.search_index.conjugated(form)
+
+    def translate(self, english, limit=DEFAULT_LIMIT):
+        """Spanish verbs and nouns for an English word or prefix ("tree")."""
+        return self.search_index.english(english, limit)
+
+    def warm_search_index(self):
+        """Open the search index, building it if a source changed (worker threads only)."""
+        try:
+            self.search_index
+        except Exception as e:
+            logger.error("Search index unavailable: %s", e)
 
-    def save_history(self):
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.history, f, ensure_ascii=False, indent=2)
+    def is_known_word(self, text):
+        """
+        Whether text is a word the app knows (verbs, their forms, nouns, glosses).
+        Never waits for the index: False until warm_search_index() has opened it.
+        """
+        index = self._search
+        return index.is_word(text) if index is not None else False
 
+    # --- History ---
     def get_today(self):
         return self.history.get(str(date.today()))
 
+    @timed("save_today")
     def save_today(self, noun: NounData, verb: VerbData, conjug):
         today = str(date.today())
-        logger.info(f"Saving data for today: noun: {noun}, verb: {verb}")
-        self.history[today] = {
-            "noun": noun,
-            "verb": verb,
-            "conjugation": conjug,
-        }
-        self.save_history()
+        logger.info("Saving data for today: noun: %s, verb: %s", noun, verb)
+        self.history.put(
+            today,
+            {
+                "noun": noun,
+                "verb": verb,
+                "conjugation": conjug,
+            },
+        )
+        self.reviews.add(noun)
+
+    def sync_reviews(self):
+        """
+        Track every noun in the history for quizzes, once per profile: it covers days
+        saved before reviews existed, save_today adds new nouns after that.
+        """
+        if self.reviews.history_synced:
+            return
+        for _, entry in self.history.items():
+            self.reviews.add(entry["noun"])
+        self.reviews.mark_history_synced()
+
+    def _seen_in_history(self, kind, words):
+        """Positions in `words` whose spanish form already appears in history as `kind`."""
+        seen = {entry[kind]["spanish"] for _, entry in self.history.items()}
+        return [i for i, word in enumerate(words) if word in seen]
 
     # --- Fetchers ---
-    def random_noun(self) -> "NounData":
-        """Fetch a random noun from the API once; if it fails, use local JSON fallback."""
+    def fallback_noun(self) -> NounData:
+        """Next unseen noun from the bundled fallback list (loaded once)."""
+        if self._fallback_words is None:
+            self._fallback_words = load_fallback_words()
+        words = self._fallback_words
+        incr("noun_fallback")
+        i = self.draws.draw(
+            "fallback_nouns",
+            len(words),
+            lambda: self._seen_in_history("noun", [w["word"] for w in words]),
+        )
+        return NounData(spanish=words[i]["word"], english=words[i]["definition"])
+
+    def pack_noun(self):
+        """Next unseen noun from the imported vocabulary packs, or None if none were imported."""
+        size = len(self.vocabulary)
+        if not size:
+            return None
+        i = self.draws.draw(
+            "vocabulary",
+            size,
+            lambda: self._seen_in_history("noun", self.vocabulary.words()),
+        )
+        spanish, english = self.vocabulary.word(i)
+        return NounData(spanish=spanish, english=english)
+
+    @timed("random_noun")
+    def random_noun(self, fallback=True) -> "NounData":
+        """
+        Fetch a random noun from the API once; if it fails, use local JSON fallback.
+        With fallback=False a failed call returns None instead of using up a fallback noun.
+        """
+        if self.noun_source == "packs":
+            noun = self.pack_noun()
+            if noun:
+                logger.info("Drew noun from vocabulary packs: %s", noun)
+                return noun
+
+        import requests
+
         try:
-            resp = requests.get(
-                "https://random-words-api.vercel.app/word/spanish", timeout=5
+            resp = self.http.get(
+                "https://random-words-api.vercel.app/word/spanish", revalidate=False
             )
+            self.online = resp.status_code == 200
             if resp.status_code == 200:
                 data = resp.json()
                 noun_spanish = data[0]["word"]
                 noun_english = data[0]["definition"]
                 logger.info(
-                    f"Generated random noun: {noun_spanish}, translation: {noun_english}"
+                    "Generated random noun: %s, translation: %s", noun_spanish, noun_english
                 )
                 return NounData(spanish=noun_spanish, english=noun_english)
+            elif not fallback:
+                logger.warning("API returned %s", resp.status_code)
+                return None
             else:
-                noun = get_fallback_word()
+                noun = self.fallback_noun()
                 logger.warning(
-                    f"API returned {resp.status_code}, using a random fallback noun: {noun}"
+                    "API returned %s, using a random fallback noun: %s",
+                    resp.status_code,
+                    noun,
                 )
                 return noun
         except requests.RequestException as e:
-            noun = get_fallback_word()
+            self.online = False
+            if not fallback:
+                logger.warning("API request failed: %s", e)
+                return None
+            noun = self.fallback_noun()
             logger.warning(
-                f"API request failed: {e}. Using a random fallback noun: {noun}"
+                "API request failed: %s. Using a random fallback noun: %s", e, noun
             )
             return noun
 
+    @timed("random_verb")
     def random_verb(self) -> VerbData:
         try:
-            with open(LOOKUP_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            keys = list(data.keys())
-            random.shuffle(keys)
-
-            for key in keys:
-                for entry in data[key]:
-                    if entry.get("tense") == "Present":
-                        verb_spanish = entry["infinitive"]
-                        verb_english = entry["translation"]
-                        logger.info(
-                            f"Generated random verb: {verb_spanish}, translation: {verb_english}"
-                        )
-                        return VerbData(spanish=verb_spanish, english=verb_english)
+            i = self.draws.draw(
+                "verbs",
+                self.verbs.count,
+                lambda: self._seen_in_history(
+                    "verb", [infinitive for infinitive, _ in self.verbs.verbs()]
+                ),
+            )
+            verb_spanish, verb_english = self.verbs.verb(i)
+            logger.info(
+                "Generated random verb: %s, translation: %s", verb_spanish, verb_english
+            )
+            return VerbData(spanish=verb_spanish, english=verb_english)
         except:
             return VerbData("error", "error")
 
+    @timed("conjugation")
     def conjugation(self, verb: str):
+        """Build the table from the local Jehle data; scrape spanishdict only for unknown verbs."""
+        if self.verbs:
+            try:
+                table = conjugation_table(self.verbs, verb)
+                if table:
+                    incr("conjugation_local")
+                    return table
+            except Exception as e:
+                logger.warning("Local conjugation failed for %s: %s", verb, e)
+
+        table = self.conjugation_cache.get(verb)
+        if table:
+            return table
+        # The fetcher and the prefetcher may want the same verb at once: one request, one write
+        return self._flights.do(("conjugation", verb), self._fetch_conjugation, verb)
+
+    def _fetch_conjugation(self, verb):
+        logger.info("%s not in local verb index, fetching conjugation online", verb)
         try:
-            url = f"https://www.spanishdict.com/conjugate/{verb}"
-            soup = BeautifulSoup(requests.get(url, timeout=5).text, "html.parser")
-            table = soup.find("table", {"class": "sTe03NLF"})
-            if not table:
-                return [["Conjugation not found"]]
-            return [
-                [cell.get_text(strip=True) for cell in row.find_all(["th", "td"])]
-                for row in table.find_all("tr")
-            ]
+            table = scrape_conjugation(self.http, verb)
+            incr("conjugation_scraped")
         except:
             return [["Error fetching conjugation"]]
+        if not table:
+            return [["Conjugation not found"]]
+        self.conjugation_cache.put(verb, table)
+        return table
@@ -0,0 +1,9 @@
+"""Default values shared by the settings layer and the modules that use them.
+
+Kept free of imports so that reading settings does not load the stores or the fetch stack.
+"""
+
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60  # In seconds
+DEFAULT_CACHE_SIZE = 500  # Max cached verbs before LRU eviction
+DEFAULT_PREFETCH_SIZE = 3  # Ready bundles kept on disk
+DEFAULT_NOUN_SOURCE = "api"  # "packs" draws nouns from imported vocabulary packs
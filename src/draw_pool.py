@@ -0,0 +1,87 @@
+import random
+import sqlite3
+import threading
+from paths import DRAW_POOLS_FILE
+from logger import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pools (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    cursor INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS permutations (
+    pool TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    item INTEGER NOT NULL,
+    PRIMARY KEY (pool, position)
+) WITHOUT ROWID;
+"""
+
+
+class DrawPools:
+    """
+    Persisted shuffled permutations of vocabularies, one per pool name, each
+    with a cursor. A draw reads the item under the cursor and advances it, so
+    nothing repeats until the pool is used up; then a new shuffle starts.
+    """
+
+    def __init__(self, path=DRAW_POOLS_FILE):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def draw(self, pool, size, seen=None):
+        """
+        Return the next index in [0, size) for the pool. seen: optional callable
+        returning indices to leave out of a fresh permutation (already in history);
+        it only runs when the pool is (re)built.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT size, length, cursor FROM pools WHERE name = ?", (pool,)
+            ).fetchone()
+            if row is None or row[0] != size:
+                length, cursor = self._shuffle(pool, size, seen() if seen else ()), 0
+            elif row[2] >= row[1]:
+                logger.info("Draw pool %s exhausted, starting a new shuffle", pool)
+                length, cursor = self._shuffle(pool, size, ()), 0
+            else:
+                length, cursor = row[1], row[2]
+
+            item = self._conn.execute(
+                "SELECT item FROM permutations WHERE pool = ? AND position = ?",
+                (pool, cursor),
+            ).fetchone()[0]
+            self._conn.execute(
+                "UPDATE pools SET cursor = ? WHERE name = ?", (cursor + 1, pool)
+            )
+        return item
+
+    def remaining(self, pool):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT length - cursor FROM pools WHERE name = ?", (pool,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _shuffle(self, pool, size, seen):
+        if size <= 0:
+            raise LookupError(f"Draw pool {pool} is empty")
+        seen = set(seen)
+        order = [i for i in range(size) if i not in seen] or list(range(size))
+        random.shuffle(order)
+        self._conn.execute("DELETE FROM permutations WHERE pool = ?", (pool,))
+        self._conn.executemany(
+            "INSERT INTO permutations VALUES (?, ?, ?)",
+            ((pool, position, item) for position, item in enumerate(order)),
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pools VALUES (?, ?, ?, 0)", (pool, size, len(order))
+        )
+        logger.info("Shuffled draw pool %s: %d of %d words unseen", pool, len(order), size)
+        return len(order)
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,115 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logger import logger
+from metrics import incr
+
+POLL_INTERVAL_MS = 50
+MAX_WORKERS = 4
+
+
+class DataFetcher:
+    """
+    Generates a noun/verb/conjugation bundle on worker threads.
+    Noun and conjugation are fetched concurrently, results are handed back to the
+    Tk thread through a queue polled with root.after. A request made while one
+    is in flight joins it, so repeated refreshes share one fetch and one save.
+    A failed request calls on_error(exception) on the Tk thread instead.
+    """
+
+    def __init__(self, root, manager, on_ready, on_error=None, poll_interval=POLL_INTERVAL_MS):
+        self.root = root
+        self.manager = manager
+        self.on_ready = on_ready
+        self.on_error = on_error
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="fetch"
+        )
+        self._results = queue.Queue()
+        self._generation = 0
+        self._futures = []
+        self._poll_job = None
+
+    @property
+    def in_flight(self):
+        return bool(self._futures)
+
+    def request(self):
+        """Start generating a new bundle (Tk thread only), unless one is already in flight."""
+        if self.in_flight:
+            incr("refresh_coalesced")
+            logger.info("A refresh is already in flight, sharing its result")
+            return
+        self._generation += 1
+        generation = self._generation
+
+        noun_future = self._executor.submit(self.manager.random_noun)
+        verb_future = self._executor.submit(self._verb_with_conjugation)
+        self._futures = [noun_future, verb_future]
+
+        remaining = [len(self._futures)]
+        lock = threading.Lock()
+
+        def done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            self._results.put((generation, noun_future, verb_future))
+
+        for future in self._futures:
+            future.add_done_callback(done)
+
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on the worker pool, outside any request (background warm-ups)."""
+        return self._executor.submit(fn, *args)
+
+    def cancel(self):
+        """Make any pending request stale without starting a new one (Tk thread only)."""
+        self._generation += 1
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+    def _verb_with_conjugation(self):
+        verb = self.manager.random_verb()
+        return verb, self.manager.conjugation(verb.spanish)
+
+    def _poll(self):
+        self._poll_job = None
+        while True:
+            try:
+                generation, noun_future, verb_future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation:
+                logger.info("Discarding result of a superseded refresh")
+                continue
+            self._futures = []
+            if noun_future.cancelled() or verb_future.cancelled():
+                continue
+            try:
+                noun = noun_future.result()
+                verb, conj = verb_future.result()
+            except Exception as e:
+                logger.error("Data generation failed: %s", e)
+                incr("fetch_failed")
+                if self.on_error:
+                    self.on_error(e)
+                continue
+            self.on_ready(
+                {"noun": noun.__dict__, "verb": verb.__dict__, "conjugation": conj}
+            )
+
+        if self._futures:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+
+    def shutdown(self):
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,163 @@
+"""
+In-memory stand-ins for the few tkinter widgets the widget window uses, so the app
+can be built, driven and benchmarked without a display. Widgets keep their options
+and layout calls; the root runs after() callbacks from update() and mainloop().
+"""
+import heapq
+import itertools
+import time
+
+
+class TclError(Exception):
+    pass
+
+
+class Font:
+    def __init__(self, root=None, font=None, **options):
+        self.options = dict(options, font=font)
+
+    def configure(self, **options):
+        self.options.update(options)
+
+
+class Widget:
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = options
+        self.children = []
+        self.manager = None  # "pack" or "grid" while laid out
+        self.layout = {}
+        self.bindings = {}
+        self.destroyed = False
+        if master is not None:
+            master.children.append(self)
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options[key]
+
+    def pack(self, **options):
+        self.manager, self.layout = "pack", options
+
+    def pack_forget(self):
+        self.manager, self.layout = None, {}
+
+    def grid(self, **options):
+        self.manager, self.layout = "grid", options
+
+    def grid_configure(self, **options):
+        self.layout.update(options)
+
+    def grid_columnconfigure(self, index, **options):
+        pass
+
+    def bind(self, sequence, callback):
+        self.bindings[sequence] = callback
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def winfo_exists(self):
+        return not self.destroyed
+
+    def destroy(self):
+        for child in list(self.children):
+            child.destroy()
+        if self.master is not None and self in self.master.children:
+            self.master.children.remove(self)
+        self.destroyed = True
+
+
+class Frame(Widget):
+    pass
+
+
+class Label(Widget):
+    pass
+
+
+class Tk(Widget):
+    """Root window: after() callbacks run from update(), in due order."""
+
+    SCREEN_WIDTH = 1920
+    SCREEN_HEIGHT = 1080
+
+    def __init__(self):
+        super().__init__()
+        self._jobs = []
+        self._cancelled = set()
+        self._ids = itertools.count(1)
+        self._running = False
+
+    def after(self, ms, callback, *args):
+        job = f"after#{next(self._ids)}"
+        heapq.heappush(self._jobs, (time.monotonic() + ms / 1000, job, callback, args))
+        return job
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, job):
+        self._cancelled.add(job)
+
+    def pending(self):
+        """Ids of the callbacks still scheduled."""
+        return [job for _, job, _, _ in self._jobs if job not in self._cancelled]
+
+    def update(self):
+        """Run every callback that is due, including ones they schedule with no delay."""
+        while self._jobs and self._jobs[0][0] <= time.monotonic():
+            _, job, callback, args = heapq.heappop(self._jobs)
+            if job in self._cancelled:
+                self._cancelled.discard(job)
+                continue
+            callback(*args)
+
+    def update_idletasks(self):
+        pass
+
+    def mainloop(self):
+        self._running = True
+        while self._running:
+            self.update()
+            time.sleep(0.01)
+
+    def quit(self):
+        self._running = False
+
+    def title(self, text=None):
+        if text is not None:
+            self.options["title"] = text
+        return self.options.get("title", "")
+
+    def overrideredirect(self, flag):
+        self.options["overrideredirect"] = flag
+
+    def geometry(self, spec):
+        self.options["geometry"] = spec
+
+    def attributes(self, *args):
+        pass
+
+    def winfo_screenwidth(self):
+        return self.SCREEN_WIDTH
+
+    def winfo_screenheight(self):
+        return self.SCREEN_HEIGHT
+
+
+class QuizDialog:
+    """Records the quiz it was asked to show; answer() stands in for the learner."""
+
+    def __init__(self, parent, noun, on_answer=None, is_known_word=None, variants=None):
+        self.noun = noun
+        self.on_answer = on_answer
+        parent.options.setdefault("quizzes", []).append(self)
+
+    def answer(self, correct):
+        if self.on_answer:
+            self.on_answer(correct)
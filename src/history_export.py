@@ -0,0 +1,297 @@
+"""Export a profile's history and quiz answers as Arrow IPC files, and query stats from them.
+
+Each run appends one part per table with only what is new since the previous export:
+completed days (today's entry can still be replaced by a refresh) and logged answers.
+Conjugation tables are stored once per distinct (verb, table) and days refer to them by id.
+
+    python src/history_export.py export [--profile NAME]
+    python src/history_export.py stats [--profile NAME] [--top 10]
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+from datetime import date
+from paths import EXPORT_DIR, HISTORY_DB_FILE, HISTORY_FILE, REVIEWS_FILE, in_data_dir
+from profiles import active_profile, migrate_to_profiles, profile_dir
+from history_store import HistoryStore
+from review_scheduler import ReviewScheduler
+from logger import logger
+from utils import atomic_write
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as ipc
+except ImportError as e:  # only this tool needs them, the widget does not
+    raise ImportError("history_export needs pyarrow and numpy: pip install pyarrow numpy") from e
+
+COMPRESSION = "zstd"
+STATE_FILE = "state.json"
+EPOCH = date(1970, 1, 1)
+
+DAYS_SCHEMA = pa.schema(
+    [
+        ("day", pa.date32()),
+        ("noun_spanish", pa.string()),
+        ("noun_english", pa.string()),
+        ("verb_spanish", pa.string()),
+        ("verb_english", pa.string()),
+        ("conjugation_id", pa.string()),
+    ]
+)
+CONJUGATIONS_SCHEMA = pa.schema(
+    [
+        ("conjugation_id", pa.string()),
+        ("verb", pa.string()),
+        ("table", pa.list_(pa.list_(pa.string()))),
+    ]
+)
+ANSWERS_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("spanish", pa.string()),
+        ("answered_at", pa.timestamp("s")),
+        ("correct", pa.bool_()),
+    ]
+)
+TABLES = {"days": DAYS_SCHEMA, "conjugations": CONJUGATIONS_SCHEMA, "answers": ANSWERS_SCHEMA}
+
+
+def conjugation_id(verb, table):
+    payload = json.dumps([verb, table], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_state(export_dir):
+    try:
+        with open(os.path.join(export_dir, STATE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"part": 0, "last_day": "", "last_answer_id": 0}
+
+
+def _save_state(export_dir, state):
+    atomic_write(os.path.join(export_dir, STATE_FILE), json.dumps(state))
+
+
+def _parts(export_dir, name):
+    """(number, path) of every part file of a table, in order."""
+    paths = glob.glob(os.path.join(export_dir, name, "part-*.arrow"))
+    return sorted((int(os.path.basename(path)[5:-6]), path) for path in paths)
+
+
+def _remove_orphans(export_dir, state):
+    """Delete parts an interrupted run wrote but never committed to the state file."""
+    for name in TABLES:
+        for number, path in _parts(export_dir, name):
+            if number > state["part"]:
+                os.remove(path)
+                logger.info("Removed uncommitted export part %s", path)
+
+
+def _write_part(export_dir, name, part, rows):
+    """Write rows (a dict of columns) as <name>/part-NNNNN.arrow; nothing if empty."""
+    table = pa.table(rows, schema=TABLES[name])
+    if not table.num_rows:
+        return 0
+    directory = os.path.join(export_dir, name)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"part-{part:05d}.arrow")
+    options = ipc.IpcWriteOptions(compression=COMPRESSION)
+    with ipc.new_file(path, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return table.num_rows
+
+
+def read_table(export_dir, name, columns=None):
+    """Every committed part of one exported table, concatenated (empty if nothing was exported yet)."""
+    committed = _load_state(export_dir)["part"]
+    parts = []
+    for number, path in _parts(export_dir, name):
+        if number > committed:
+            continue
+        with pa.memory_map(path) as source:
+            parts.append(ipc.open_file(source).read_all())
+    if not parts:
+        return TABLES[name].empty_table().select(columns or TABLES[name].names)
+    table = pa.concat_tables(parts)
+    return table.select(columns) if columns else table
+
+
+def export(history, reviews, export_dir):
+    """Append what changed since the last export; returns rows written per table."""
+    os.makedirs(export_dir, exist_ok=True)
+    state = _load_state(export_dir)
+    _remove_orphans(export_dir, state)
+    part = state["part"] + 1
+    today = str(date.today())
+    known = set(read_table(export_dir, "conjugations", ["conjugation_id"])[0].to_pylist())
+
+    days = {name: [] for name in DAYS_SCHEMA.names}
+    conjugations = {name: [] for name in CONJUGATIONS_SCHEMA.names}
+    last_day = state["last_day"]
+    for day, entry in history.items(after=state["last_day"]):
+        if day >= today:
+            break
+        verb = entry["verb"]["spanish"]
+        table_id = conjugation_id(verb, entry["conjugation"])
+        if table_id not in known:
+            known.add(table_id)
+            conjugations["conjugation_id"].append(table_id)
+            conjugations["verb"].append(verb)
+            conjugations["table"].append(entry["conjugation"])
+        days["day"].append(date.fromisoformat(day))
+        days["noun_spanish"].append(entry["noun"]["spanish"])
+        days["noun_english"].append(entry["noun"]["english"])
+        days["verb_spanish"].append(verb)
+        days["verb_english"].append(entry["verb"]["english"])
+        days["conjugation_id"].append(table_id)
+        last_day = day
+
+    rows = reviews.answers(state["last_answer_id"])
+    answers = {
+        "id": [row[0] for row in rows],
+        "spanish": [row[1] for row in rows],
+        "answered_at": [int(row[2]) for row in rows],
+        "correct": [bool(row[3]) for row in rows],
+    }
+
+    written = {
+        "days": _write_part(export_dir, "days", part, days),
+        "conjugations": _write_part(export_dir, "conjugations", part, conjugations),
+        "answers": _write_part(export_dir, "answers", part, answers),
+    }
+    if any(written.values()):
+        _save_state(
+            export_dir,
+            {
+                "part": part,
+                "last_day": last_day,
+                "last_answer_id": rows[-1][0] if rows else state["last_answer_id"],
+            },
+        )
+    logger.info("Exported %s to %s", written, export_dir)
+    return written
+
+
+def _runs(starts, values):
+    """
+    Lengths of runs of True in `values`, where `starts` marks the first element of
+    every group. Returns (run lengths, index of the first element of each run).
+    """
+    run_id = np.cumsum(starts | ~values) - 1
+    lengths = np.bincount(run_id, weights=values).astype(np.int64)
+    firsts = np.flatnonzero(np.r_[True, run_id[1:] != run_id[:-1]])
+    return lengths, firsts
+
+
+class ExportStats:
+    """Stats over an export directory, computed on whole columns (Arrow compute / numpy)."""
+
+    def __init__(self, export_dir):
+        self.days = read_table(export_dir, "days")
+        self.answers = read_table(export_dir, "answers")
+
+    def accuracy_per_word(self):
+        """Table of spanish, answers, correct and accuracy, least accurate first."""
+        grouped = self.answers.group_by("spanish").aggregate(
+            [("correct", "count"), ("correct", "sum")]
+        )
+        grouped = grouped.select(["spanish", "correct_count", "correct_sum"]).rename_columns(
+            ["spanish", "answers", "correct"]
+        )
+        accuracy = pc.divide(pc.cast(grouped["correct"], pa.float64()), grouped["answers"])
+        return grouped.append_column("accuracy", accuracy).sort_by(
+            [("accuracy", "ascending"), ("answers", "descending")]
+        )
+
+    def word_streaks(self):
+        """Table of spanish, current and longest run of correct answers in a row."""
+        if not self.answers.num_rows:
+            return pa.table(
+                {"spanish": [], "current": [], "longest": []},
+                schema=pa.schema(
+                    [("spanish", pa.string()), ("current", pa.int64()), ("longest", pa.int64())]
+                ),
+            )
+        ordered = self.answers.sort_by([("spanish", "ascending"), ("answered_at", "ascending")])
+        words = ordered["spanish"].combine_chunks().dictionary_encode()
+        codes = words.indices.to_numpy()
+        correct = ordered["correct"].to_numpy()
+        word_starts = np.r_[True, codes[1:] != codes[:-1]]
+
+        lengths, firsts = _runs(word_starts, correct)
+        run_words = codes[firsts]
+        longest = np.zeros(len(words.dictionary), dtype=np.int64)
+        np.maximum.at(longest, run_words, lengths)
+        # Runs are in order, so the last run of each word is its current one
+        last_run = np.flatnonzero(np.r_[run_words[1:] != run_words[:-1], True])
+        current = np.zeros_like(longest)
+        current[run_words[last_run]] = lengths[last_run]
+        return pa.table(
+            {"spanish": words.dictionary, "current": current, "longest": longest}
+        ).sort_by([("current", "descending"), ("longest", "descending")])
+
+    def day_streaks(self):
+        """
+        (current, longest) runs of consecutive calendar days with an entry. Exports
+        stop at yesterday, so a run ending yesterday is still current.
+        """
+        if not self.days.num_rows:
+            return 0, 0
+        days = np.unique(self.days["day"].to_numpy().astype("datetime64[D]").astype(np.int64))
+        starts = np.r_[True, np.diff(days) != 1]
+        lengths, _ = _runs(starts, np.ones(len(days), dtype=bool))
+        yesterday = (date.today() - EPOCH).days - 1
+        current = int(lengths[-1]) if days[-1] >= yesterday else 0
+        return current, int(lengths.max())
+
+    def summary(self):
+        answers = self.answers.num_rows
+        correct = pc.sum(self.answers["correct"]).as_py() or 0
+        current, longest = self.day_streaks()
+        return {
+            "days": self.days.num_rows,
+            "distinct_verbs": pc.count_distinct(self.days["verb_spanish"]).as_py(),
+            "answers": answers,
+            "accuracy": correct / answers if answers else None,
+            "current_day_streak": current,
+            "longest_day_streak": longest,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("export", "stats"))
+    parser.add_argument("--profile", help="defaults to the active profile")
+    parser.add_argument("--top", type=int, default=10, help="words listed by stats")
+    args = parser.parse_args()
+
+    migrate_to_profiles()
+    directory = profile_dir(args.profile or active_profile())
+    export_dir = in_data_dir(EXPORT_DIR, directory)
+    if args.command == "export":
+        history = HistoryStore(
+            in_data_dir(HISTORY_DB_FILE, directory), in_data_dir(HISTORY_FILE, directory)
+        )
+        reviews = ReviewScheduler(in_data_dir(REVIEWS_FILE, directory))
+        written = export(history, reviews, export_dir)
+        print(", ".join(f"{name}: {rows} new rows" for name, rows in written.items()))
+        return
+
+    stats = ExportStats(export_dir)
+    for key, value in stats.summary().items():
+        print(f"{key}: {value}")
+    print("\nLeast accurate words:")
+    for row in stats.accuracy_per_word().slice(0, args.top).to_pylist():
+        print(f"  {row['spanish']:<20}{row['correct']}/{row['answers']}  {row['accuracy']:.0%}")
+    print("\nLongest current streaks:")
+    for row in stats.word_streaks().slice(0, args.top).to_pylist():
+        print(f"  {row['spanish']:<20}{row['current']} (best {row['longest']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import json
+import os
+import sqlite3
+import threading
+from paths import HISTORY_FILE, HISTORY_DB_FILE
+from logger import logger
+
+ITER_BATCH_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    day TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class HistoryStore:
+    """
+    One row per day keyed by ISO date. Opening the store does not read the
+    history, lookups go through the primary key and each save is a single
+    committed upsert, so neither cost grows with the number of days stored.
+    """
+
+    def __init__(self, path=HISTORY_DB_FILE, legacy_path=HISTORY_FILE):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        if legacy_path and os.path.exists(legacy_path):
+            self._migrate(legacy_path)
+
+    def _migrate(self, legacy_path):
+        """One-time import of the old history.json; the file is kept as <name>.migrated."""
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error("Cannot migrate %s: %s", legacy_path, e)
+            return
+
+        with self._lock, self._conn:
+            # Entries already in the store win over the legacy file
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO history VALUES (?, ?)",
+                [
+                    (day, json.dumps(entry, ensure_ascii=False))
+                    for day, entry in history.items()
+                ],
+            )
+        os.replace(legacy_path, legacy_path + ".migrated")
+        logger.info("Migrated %d days from %s", len(history), legacy_path)
+
+    def get(self, day: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM history WHERE day = ?", (day,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, day: str, entry):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO history VALUES (?, ?)",
+                (day, json.dumps(entry, ensure_ascii=False)),
+            )
+
+    def __contains__(self, day):
+        with self._lock:
+            return (
+                self._conn.execute(
+                    "SELECT 1 FROM history WHERE day = ?", (day,)
+                ).fetchone()
+                is not None
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def items(self, after=""):
+        """Yield (day, entry) for days after `after`, oldest first, ITER_BATCH_SIZE rows at a time."""
+        last = after
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT day, payload FROM history WHERE day > ? ORDER BY day LIMIT ?",
+                    (last, ITER_BATCH_SIZE),
+                ).fetchall()
+            for day, payload in rows:
+                yield day, json.loads(payload)
+            if len(rows) < ITER_BATCH_SIZE:
+                return
+            last = rows[-1][0]
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,175 @@
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from logger import logger
+from metrics import timed
+
+DEFAULT_TIMEOUT = 5  # In seconds
+MAX_RETRIES = 2
+BACKOFF_FACTOR = 0.5  # 0.5s, 1s between retries
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+POOL_SIZE = 4
+MAX_CONNECTIONS_PER_HOST = 2
+REQUESTS_PER_SECOND = 2.0  # Per host, sustained
+REQUEST_BURST = 4  # Requests per host allowed back to back before the rate applies
+MAX_VALIDATED = 256  # URLs whose validators and body are kept for revalidation (LRU)
+# Headers kept with a stored body: the validators plus what decoding it needs
+STORED_HEADERS = ("ETag", "Last-Modified", "Content-Type")
+
+
+class TokenBucket:
+    """Per-host rate limit. acquire() reserves a token and sleeps until it is due."""
+
+    def __init__(self, rate=REQUESTS_PER_SECOND, burst=REQUEST_BURST):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1  # may go negative: later callers queue behind this one
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class HttpClient:
+    """
+    Shared fetch layer for every fetcher in data_manager: one pooled keep-alive
+    session, bounded retries with backoff, ETag/Last-Modified revalidation, a
+    cap on concurrent requests per host and a per-host rate limit.
+    """
+
+    def __init__(
+        self,
+        timeout=DEFAULT_TIMEOUT,
+        retries=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        max_per_host=MAX_CONNECTIONS_PER_HOST,
+        rate=REQUESTS_PER_SECOND,
+        burst=REQUEST_BURST,
+    ):
+        TokenBucket(rate, burst)  # validates both now rather than on the first request
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.rate = rate
+        self.burst = burst
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots = {}
+        self._host_buckets = {}
+        self._validated = OrderedDict()  # url -> (headers, body, encoding) of the last 200
+
+    def _slot(self, host):
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _throttle(self, host):
+        with self._lock:
+            if host not in self._host_buckets:
+                self._host_buckets[host] = TokenBucket(self.rate, self.burst)
+            bucket = self._host_buckets[host]
+        waited = bucket.acquire()
+        if waited:
+            logger.debug("Rate limited %s for %.2f s", host, waited)
+
+    @timed("http_get")
+    def get(self, url, timeout=None, revalidate=True) -> requests.Response:
+        """GET url. A 304 answer to a conditional request returns the stored response."""
+        headers = {}
+        cached = self._stored(url) if revalidate else None
+        if cached is not None:
+            stored_headers = cached[0]
+            if "ETag" in stored_headers:
+                headers["If-None-Match"] = stored_headers["ETag"]
+            if "Last-Modified" in stored_headers:
+                headers["If-Modified-Since"] = stored_headers["Last-Modified"]
+
+        host = urlsplit(url).netloc
+        self._throttle(host)
+        start = time.perf_counter()
+        with self._slot(host):
+            resp = self.session.get(
+                url, headers=headers, timeout=timeout or self.timeout
+            )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info("GET %s -> %s in %.0f ms", url, resp.status_code, elapsed_ms)
+
+        if resp.status_code == 304 and cached is not None:
+            return self._stored_response(url, cached)
+        if revalidate and resp.status_code == 200 and (
+            "ETag" in resp.headers or "Last-Modified" in resp.headers
+        ):
+            self._store(url, resp)
+        return resp
+
+    def _stored(self, url):
+        with self._lock:
+            entry = self._validated.get(url)
+            if entry is not None:
+                self._validated.move_to_end(url)
+            return entry
+
+    def _store(self, url, resp):
+        headers = {name: resp.headers[name] for name in STORED_HEADERS if name in resp.headers}
+        with self._lock:
+            self._validated[url] = (headers, resp.content, resp.encoding)
+            self._validated.move_to_end(url)
+            while len(self._validated) > MAX_VALIDATED:
+                self._validated.popitem(last=False)
+
+    @staticmethod
+    def _stored_response(url, entry):
+        """A 200 Response rebuilt from what _store kept, served for a 304."""
+        headers, body, encoding = entry
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = url
+        resp.headers.update(headers)
+        resp._content = body
+        resp.encoding = encoding
+        return resp
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
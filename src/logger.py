@@ -1,18 +1,68 @@
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
-from paths import LOGS_DIR
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from paths import LOGS_DIR, SETTINGS_FILE, PROFILES_DIR, ACTIVE_PROFILE_FILE
 
 LOG_FILE = os.path.join(LOGS_DIR, "SpanishWidget.log")
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+LOG_MAX_BYTES = 1024 * 1024  # Rotate the log file at 1 MB
+LOG_BACKUPS = 3  # Rotated files kept next to it
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8"),
-        logging.StreamHandler(sys.stdout),  # only stdout, not stderr
-    ],
+
+def _settings_file():
+    # Same lookup as profiles.profile_file, which logs and so cannot be imported here
+    try:
+        with open(ACTIVE_PROFILE_FILE, "r", encoding="utf-8") as f:
+            profile = json.load(f)["active"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        profile = "default"
+    path = os.path.join(PROFILES_DIR, str(profile), os.path.basename(SETTINGS_FILE))
+    return path if os.path.exists(path) else SETTINGS_FILE  # not migrated yet
+
+
+def _log_settings():
+    # settings_manager logs, so it cannot be imported here; read the file directly
+    try:
+        with open(_settings_file(), "r", encoding="utf-8") as f:
+            settings = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        settings = {}
+    level = str(settings.get("log_level", DEFAULT_LOG_LEVEL)).upper()
+    if not isinstance(logging.getLevelName(level), int):
+        level = DEFAULT_LOG_LEVEL
+    return level, settings.get("log_format", DEFAULT_LOG_FORMAT)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue the record as is; the stock prepare() would format it on the caller's thread."""
+
+    def prepare(self, record):
+        return record
+
+
+_level, _format = _log_settings()
+_formatter = logging.Formatter(_format)
+_file_handler = RotatingFileHandler(
+    LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
 )
+_stream_handler = logging.StreamHandler(sys.stdout)  # only stdout, not stderr
+for _handler in (_file_handler, _stream_handler):
+    _handler.setFormatter(_formatter)
+
+# Callers only enqueue the record; formatting and I/O happen on the listener thread
+_queue = queue.SimpleQueue()
+_listener = QueueListener(
+    _queue, _file_handler, _stream_handler, respect_handler_level=True
+)
+_listener.start()
+atexit.register(_listener.stop)  # drains whatever is still queued
+
+logging.basicConfig(level=_level, handlers=[_DeferredQueueHandler(_queue)])
 
 logger = logging.getLogger("spanish_widget")
 
@@ -1,4 +1,16 @@
+import sys
+import time
+
+STARTED_AT = time.perf_counter()
+
 from app import SpanishWidgetApp
 
 if __name__ == "__main__":
-    SpanishWidgetApp().run()
+    profile = None
+    if "--profile-startup" in sys.argv[1:]:
+        # Print per-phase startup timings and exit once the tray is up
+        from startup_profile import StartupProfile
+
+        profile = StartupProfile(started_at=STARTED_AT)
+        profile.mark("imports")
+    SpanishWidgetApp(profile=profile).run()
@@ -0,0 +1,153 @@
+import functools
+import json
+import threading
+import time
+from collections import deque
+from paths import METRICS_FILE
+from logger import logger
+from utils import atomic_write
+
+DEFAULT_FLUSH_INTERVAL = 60  # In seconds
+SAMPLE_WINDOW = 1024  # Most recent durations kept per span for percentiles
+PERCENTILES = (50, 90, 99)
+
+
+class _Span:
+    __slots__ = ("count", "total_ns", "max_ns", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+
+class Metrics:
+    """
+    In-process timing spans and counters. Recording a span is two
+    perf_counter_ns calls and a deque append, with no lock (a racing update
+    can at worst drop one increment); percentiles over the last SAMPLE_WINDOW
+    durations are only computed in snapshot(), i.e. when the file is flushed.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._spans = {}
+        self._counters = {}
+        self._lock = threading.Lock()  # only guards creating new names
+        self._flush_lock = threading.Lock()
+        self._exporter = None
+        self._stop = threading.Event()
+
+    def _span(self, name):
+        span = self._spans.get(name)
+        if span is None:
+            with self._lock:
+                span = self._spans.setdefault(name, _Span())
+        return span
+
+    def record(self, name, elapsed_ns):
+        span = self._span(name)
+        span.samples.append(elapsed_ns)
+        span.total_ns += elapsed_ns
+        if elapsed_ns > span.max_ns:
+            span.max_ns = elapsed_ns
+        span.count += 1
+
+    def timed(self, name):
+        """Decorator timing every call of the wrapped function as span `name`."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter_ns() - start)
+
+            return wrapper
+
+        return decorator
+
+    def span(self, name):
+        """Context manager timing its block as span `name`."""
+        return _Timer(self, name)
+
+    def incr(self, name, amount=1):
+        if not self.enabled:
+            return
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, [0])
+        counter[0] += amount
+
+    def snapshot(self):
+        spans = {}
+        for name, span in list(self._spans.items()):
+            samples = sorted(span.samples)
+            if not samples:
+                continue
+            spans[name] = {
+                "count": span.count,
+                "mean_ms": span.total_ns / span.count / 1e6,
+                "max_ms": span.max_ns / 1e6,
+                **{
+                    f"p{p}_ms": samples[min(len(samples) - 1, len(samples) * p // 100)] / 1e6
+                    for p in PERCENTILES
+                },
+            }
+        counters = {name: value[0] for name, value in list(self._counters.items())}
+        return {"generated_at": time.time(), "spans": spans, "counters": counters}
+
+    def flush(self, path=METRICS_FILE):
+        with self._flush_lock:
+            atomic_write(path, json.dumps(self.snapshot(), indent=2))
+
+    def start_exporter(self, interval=DEFAULT_FLUSH_INTERVAL, path=METRICS_FILE):
+        """Flush to `path` every `interval` seconds on a daemon thread."""
+        if self._exporter or not self.enabled:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.flush(path)
+                except OSError as e:
+                    logger.warning("Could not write metrics to %s: %s", path, e)
+
+        self._exporter = threading.Thread(target=run, name="metrics", daemon=True)
+        self._exporter.start()
+
+    def stop_exporter(self, path=METRICS_FILE):
+        self._stop.set()
+        if self._exporter:
+            self.flush(path)  # keep the numbers of the last interval
+            self._exporter = None
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        if self.metrics.enabled:
+            self.metrics.record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+# Process-wide registry used by the instrumented modules
+metrics = Metrics()
+timed = metrics.timed
+span = metrics.span
+incr = metrics.incr
@@ -18,7 +18,24 @@ for dir in (DATA_DIR, LOGS_DIR, ASSETS_DIR, DICTIONARY_DIR):
 
 # Files
 LOOKUP_FILE = os.path.join(DICTIONARY_DIR, "jehle_verb_lookup.json")
+VERB_INDEX_FILE = os.path.join(DICTIONARY_DIR, "jehle_verb_index.sqlite3")
 FALLBACK_NOUNS_FILE = os.path.join(DICTIONARY_DIR, "fallback_nouns.json")
-HISTORY_FILE = os.path.join(DATA_DIR, "history.json")
+HISTORY_FILE = os.path.join(DATA_DIR, "history.json")  # Legacy, migrated on first start
+HISTORY_DB_FILE = os.path.join(DATA_DIR, "history.sqlite3")
 SETTINGS_FILE = os.path.join(DATA_DIR, "settings.json")
+CONJUGATION_CACHE_FILE = os.path.join(DATA_DIR, "conjugation_cache.sqlite3")
+PREFETCH_FILE = os.path.join(DATA_DIR, "prefetch_queue.json")
+REVIEWS_FILE = os.path.join(DATA_DIR, "reviews.sqlite3")
+DRAW_POOLS_FILE = os.path.join(DATA_DIR, "draw_pools.sqlite3")
+VOCABULARY_FILE = os.path.join(DATA_DIR, "vocabulary.sqlite3")
+EXPORT_DIR = os.path.join(DATA_DIR, "export")  # Columnar history/quiz export, per profile
+SEARCH_INDEX_FILE = os.path.join(DATA_DIR, "search_index.sqlite3")
+PROFILES_DIR = os.path.join(DATA_DIR, "profiles")  # One directory of per-learner files each
+ACTIVE_PROFILE_FILE = os.path.join(DATA_DIR, "active_profile.json")
+METRICS_FILE = os.path.join(LOGS_DIR, "metrics.json")
 TRAY_ICON = os.path.join(ASSETS_DIR, "dictionary.ico")
+
+
+def in_data_dir(path, data_dir=None):
+    """The same data file under another data directory (a scratch dir for benchmarks)."""
+    return path if data_dir is None else os.path.join(data_dir, os.path.basename(path))
@@ -0,0 +1,103 @@
+import os
+import sys
+from types import SimpleNamespace
+from logger import logger
+
+BACKEND_ENV = "SPANISH_WIDGET_BACKEND"  # "windows" or "headless", overrides detection
+
+
+def tk_widgets():
+    """The real Tk widget classes the window is built from."""
+    import tkinter as tk
+    import tkinter.font as tkfont
+    from quiz import QuizDialog
+
+    return SimpleNamespace(
+        Tk=tk.Tk,
+        Frame=tk.Frame,
+        Label=tk.Label,
+        Font=tkfont.Font,
+        QuizDialog=QuizDialog,
+        TclError=tk.TclError,
+    )
+
+
+def stub_widgets():
+    """In-memory stand-ins with the same interface, for running without a display."""
+    import headless_tk
+
+    return headless_tk
+
+
+def has_display():
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+class WindowsBackend:
+    """Click-through transparent window and a pystray tray icon."""
+
+    name = "windows"
+
+    def configure_window(self, root, transparent_color):
+        import ctypes
+
+        hwnd = ctypes.windll.user32.FindWindowW(None, root.title())
+        ctypes.windll.user32.SetWindowLongW(hwnd, -20, 0x80000 | 0x20)
+        root.attributes("-transparentcolor", transparent_color)
+        root.attributes("-topmost", False)
+
+    def widgets(self):
+        return tk_widgets()
+
+    def create_tray(self, app):
+        from tray import TrayController
+
+        return TrayController(app)
+
+
+class NullTray:
+    def __init__(self, app):
+        self.app = app
+
+    def start(self):
+        pass
+
+
+class HeadlessBackend:
+    """
+    No window tweaks and no tray: for Linux CI, tests and benchmarks. The window
+    uses Tk when there is a display and the stand-ins from headless_tk otherwise.
+    """
+
+    name = "headless"
+
+    def __init__(self, stub=None):
+        """stub: True or False to force the widget set, None to pick by display."""
+        self.stub = stub
+
+    def configure_window(self, root, transparent_color):
+        pass
+
+    def widgets(self):
+        stub = not has_display() if self.stub is None else self.stub
+        if stub:
+            logger.info("No display, using in-memory widgets")
+        return stub_widgets() if stub else tk_widgets()
+
+    def create_tray(self, app):
+        return NullTray(app)
+
+
+BACKENDS = {backend.name: backend for backend in (WindowsBackend, HeadlessBackend)}
+
+
+def get_backend(name=None):
+    name = name or os.environ.get(BACKEND_ENV) or (
+        "windows" if sys.platform == "win32" else "headless"
+    )
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown platform backend: {name}")
+    logger.info("Using %s platform backend", name)
+    return BACKENDS[name]()
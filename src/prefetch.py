@@ -0,0 +1,124 @@
+import json
+import threading
+from paths import PREFETCH_FILE
+from logger import logger
+from metrics import incr
+from defaults import DEFAULT_PREFETCH_SIZE
+from utils import MS_IN_SECOND, atomic_write
+
+IDLE_REFILL_INTERVAL = 10 * 60  # In seconds
+OFFLINE_RETRY_INTERVAL = 60  # In seconds, probe for reconnect while offline
+
+
+class PrefetchQueue:
+    """FIFO of ready noun/verb/conjugation bundles persisted in the data directory."""
+
+    def __init__(self, path=PREFETCH_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._items = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _save(self):
+        atomic_write(self.path, json.dumps(self._items, ensure_ascii=False))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def push(self, bundle):
+        with self._lock:
+            self._items.append(bundle)
+            self._save()
+
+    def pop(self):
+        with self._lock:
+            if not self._items:
+                return None
+            bundle = self._items.pop(0)
+            self._save()
+            return bundle
+
+
+class Prefetcher:
+    """
+    Keeps `size` bundles ready in a PrefetchQueue. Refills on a background thread
+    after every pop and on an idle timer; while the noun API is unreachable the
+    timer doubles as a reconnect probe so the queue is not filled with fallbacks.
+    """
+
+    def __init__(self, root, manager, size=DEFAULT_PREFETCH_SIZE, queue=None):
+        self.root = root
+        self.manager = manager
+        self.size = size
+        self.queue = queue if queue is not None else PrefetchQueue()
+        self._thread = None
+        self._timer_job = None
+        self._generation = 0  # Bumped by stop(); a fill thread of an older one exits
+
+    def start(self):
+        self.refill()
+        self._arm_timer(IDLE_REFILL_INTERVAL)
+
+    def pop(self):
+        bundle = self.queue.pop()
+        incr("prefetch_hit" if bundle else "prefetch_miss")
+        logger.info(
+            "Prefetch queue %s, %d bundles left", "hit" if bundle else "empty", len(self.queue)
+        )
+        self.refill()
+        return bundle
+
+    def refill(self):
+        if self._thread and self._thread.is_alive():
+            return
+        if len(self.queue) >= self.size:
+            return
+        self._thread = threading.Thread(
+            target=self._fill, args=(self._generation, self.queue), daemon=True
+        )
+        self._thread.start()
+
+    def _fill(self, generation, queue):
+        """Fill `queue`, the one current when the thread started, until stop() is called."""
+        try:
+            while generation == self._generation and len(queue) < self.size:
+                noun = self.manager.random_noun(fallback=False)
+                if noun is None:
+                    logger.info("Noun API unreachable, pausing prefetch until reconnect")
+                    return
+                verb = self.manager.random_verb()
+                conj = self.manager.conjugation(verb.spanish)
+                if generation != self._generation:
+                    logger.info("Prefetch stopped, dropping the bundle in progress")
+                    return
+                # The captured queue: a bundle never lands in another profile's queue
+                queue.push({"noun": noun.__dict__, "verb": verb.__dict__, "conjugation": conj})
+                logger.info("Prefetched bundle (%d/%d)", len(queue), self.size)
+        except Exception as e:
+            # After stop() this is usually a store closed by a profile switch
+            if generation == self._generation:
+                logger.error("Prefetch failed: %s", e)
+
+    def _arm_timer(self, seconds):
+        self._timer_job = self.root.after(seconds * MS_IN_SECOND, self._on_timer)
+
+    def _on_timer(self):
+        self.refill()
+        self._arm_timer(
+            IDLE_REFILL_INTERVAL if self.manager.online else OFFLINE_RETRY_INTERVAL
+        )
+
+    def stop(self):
+        """Stop refilling. A fill in progress finishes its fetch but pushes nothing."""
+        self._generation += 1
+        self._thread = None
+        if self._timer_job:
+            self.root.after_cancel(self._timer_job)
+            self._timer_job = None
@@ -0,0 +1,102 @@
+import json
+import os
+import re
+from paths import (
+    ACTIVE_PROFILE_FILE,
+    PROFILES_DIR,
+    HISTORY_FILE,
+    HISTORY_DB_FILE,
+    REVIEWS_FILE,
+    DRAW_POOLS_FILE,
+    SETTINGS_FILE,
+    PREFETCH_FILE,
+    in_data_dir,
+)
+from logger import logger
+from utils import atomic_write
+
+DEFAULT_PROFILE = "default"
+PROFILE_NAME = re.compile(r"^[\w-]{1,32}$")  # Used as a directory name
+# Per-learner files. Vocabulary packs, the conjugation cache and the search index
+# describe the language, not the learner, and stay shared in the data directory.
+PROFILE_FILES = (
+    HISTORY_DB_FILE,
+    HISTORY_FILE,
+    REVIEWS_FILE,
+    DRAW_POOLS_FILE,
+    SETTINGS_FILE,
+    PREFETCH_FILE,
+)
+SQLITE_SIDECARS = ("-wal", "-shm")
+
+
+def validate_name(name):
+    if not PROFILE_NAME.match(name):
+        raise ValueError(
+            f"Invalid profile name {name!r}: use up to 32 letters, digits, _ or -"
+        )
+    return name
+
+
+def profile_dir(name, data_dir=None):
+    """Directory holding one profile's files, created on first use."""
+    path = os.path.join(in_data_dir(PROFILES_DIR, data_dir), validate_name(name))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def list_profiles(data_dir=None):
+    path = in_data_dir(PROFILES_DIR, data_dir)
+    if not os.path.isdir(path):
+        return []
+    return sorted(
+        name
+        for name in os.listdir(path)
+        if PROFILE_NAME.match(name) and os.path.isdir(os.path.join(path, name))
+    )
+
+
+def active_profile(data_dir=None):
+    try:
+        with open(in_data_dir(ACTIVE_PROFILE_FILE, data_dir), "r", encoding="utf-8") as f:
+            return validate_name(json.load(f)["active"])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return DEFAULT_PROFILE
+
+
+def set_active_profile(name, data_dir=None):
+    path = in_data_dir(ACTIVE_PROFILE_FILE, data_dir)
+    atomic_write(path, json.dumps({"active": validate_name(name)}))
+
+
+def profile_file(path, data_dir=None):
+    """`path` (a default from paths.py) inside the active profile."""
+    return in_data_dir(path, profile_dir(active_profile(data_dir), data_dir))
+
+
+def migrate_to_profiles(data_dir=None):
+    """
+    Move the files of a single-user install into the default profile. Every entry
+    point calls this before resolving a profile path. It acts only while per-learner
+    files are still at the top of the data directory (the profiles directory alone
+    says nothing, any profile lookup creates it) and never overwrites a profile's file.
+    """
+    target = None
+    moved = 0
+    for path in PROFILE_FILES:
+        source = in_data_dir(path, data_dir)
+        if not os.path.exists(source):
+            continue
+        target = target or profile_dir(DEFAULT_PROFILE, data_dir)
+        destination = os.path.join(target, os.path.basename(source))
+        if os.path.exists(destination):
+            logger.warning(
+                "Not moving %s, the %s profile already has one", source, DEFAULT_PROFILE
+            )
+            continue
+        for suffix in ("",) + SQLITE_SIDECARS:
+            if os.path.exists(source + suffix):
+                os.replace(source + suffix, destination + suffix)
+                moved += 1
+    if moved:
+        logger.info("Moved %d files into the %s profile", moved, DEFAULT_PROFILE)
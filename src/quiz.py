@@ -1,5 +1,6 @@
 import tkinter as tk
 import random
+from answer_matching import accepted_answers, is_correct
 
 BG_COLOR = "#2e2e2e"
 TEXT_COLOR = "#f9f9f9"
@@ -8,8 +9,17 @@ CLOSE_TIME_AFTER_RESPONSE = 750
 
 
 class QuizDialog(tk.Toplevel):
-    def __init__(self, parent, noun):
+    def __init__(self, parent, noun, on_answer=None, is_known_word=None, variants=None):
+        """
+        on_answer: optional callback, called once with True/False for the given answer.
+        is_known_word: optional predicate, so a near miss that is another word is wrong.
+        variants: accepted answers per direction ({"spanish", "english"}), precomputed
+        by the review scheduler; computed here if None.
+        """
         super().__init__(parent)
+        self.on_answer = on_answer
+        self.is_known_word = is_known_word
+        self._answered = False
         self.title("Quiz Time!")
         self.config(bg=BG_COLOR)
         self.geometry("400x200")
@@ -30,6 +40,7 @@ class QuizDialog(tk.Toplevel):
         else:
             self.question = f"Translate '{noun['spanish']}' to English:"
             self.answer = noun["english"]
+        self.accepted = variants[ask_for] if variants else accepted_answers(self.answer)
 
         tk.Label(
             self,
@@ -74,8 +85,13 @@ class QuizDialog(tk.Toplevel):
         self.bind("<Return>", lambda e: self.check_answer())
 
     def check_answer(self):
-        user_ans = self.entry_var.get().strip().lower()
-        if user_ans == self.answer.strip().lower():
+        if self._answered:
+            return
+        self._answered = True
+        correct = is_correct(self.entry_var.get(), self.accepted, self.is_known_word)
+        if self.on_answer:
+            self.on_answer(correct)
+        if correct:
             self.feedback.config(text="✅ Correct!", fg="#4CAF50")
         else:
             self.feedback.config(text=f"❌ Wrong! Correct: {self.answer}", fg="#FF5252")
@@ -0,0 +1,206 @@
+import heapq
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from paths import REVIEWS_FILE
+from logger import logger
+from answer_matching import accepted_answers
+
+DAY = 24 * 60 * 60  # In seconds
+FIRST_INTERVAL = DAY
+SECOND_INTERVAL = 6 * DAY
+RELEARN_INTERVAL = 10 * 60  # In seconds, a missed word comes back soon
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+CORRECT_QUALITY = 4  # SM-2 grades, 0-5
+WRONG_QUALITY = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    spanish TEXT PRIMARY KEY,
+    english TEXT NOT NULL,
+    ease REAL NOT NULL,
+    interval REAL NOT NULL,
+    repetitions INTEGER NOT NULL,
+    due_at REAL NOT NULL,
+    variants TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    spanish TEXT NOT NULL,
+    answered_at REAL NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def answer_variants(spanish, english):
+    """Accepted answers per quiz direction, keyed by the language asked for."""
+    return {"spanish": accepted_answers(spanish), "english": accepted_answers(english)}
+
+
+@dataclass
+class ReviewItem:
+    spanish: str
+    english: str
+    ease: float = DEFAULT_EASE
+    interval: float = 0
+    repetitions: int = 0
+    due_at: float = 0
+    # answer_variants(), computed once when the noun starts being reviewed
+    variants: dict = field(default=None, repr=False, compare=False)
+
+    def review(self, quality, now):
+        """Apply one SM-2 step for an answer graded 0-5."""
+        if quality < 3:
+            self.repetitions = 0
+            self.interval = RELEARN_INTERVAL
+        else:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = FIRST_INTERVAL
+            elif self.repetitions == 2:
+                self.interval = SECOND_INTERVAL
+            else:
+                self.interval *= self.ease
+        self.ease = max(
+            MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        )
+        self.due_at = now + self.interval
+
+
+class ReviewScheduler:
+    """
+    Quiz backlog over every noun seen so far. Items sit in a min-heap keyed by
+    due time; a rescheduled item gets a fresh heap entry and the outdated one
+    is skipped when it reaches the top, so add/record/peek are all O(log n).
+    """
+
+    def __init__(self, path=REVIEWS_FILE):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(reviews)")}
+        if "variants" not in columns:  # reviews saved before answers were precomputed
+            self._conn.execute("ALTER TABLE reviews ADD COLUMN variants TEXT")
+        self._items = {}
+        missing = []
+        for *row, variants in self._conn.execute(
+            "SELECT spanish, english, ease, interval, repetitions, due_at, variants FROM reviews"
+        ):
+            item = ReviewItem(*row)
+            if variants:
+                item.variants = {key: frozenset(value) for key, value in json.loads(variants).items()}
+            else:
+                item.variants = answer_variants(item.spanish, item.english)
+                missing.append(item)
+            self._items[item.spanish] = item
+        if missing:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE reviews SET variants = ? WHERE spanish = ?",
+                    ((self._dump_variants(item), item.spanish) for item in missing),
+                )
+        self._heap = [(item.due_at, key) for key, item in self._items.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, spanish):
+        return spanish in self._items
+
+    def add(self, noun, now=None):
+        """Start tracking a noun dict ({spanish, english}); it is due right away."""
+        with self._lock:
+            if noun["spanish"] in self._items:
+                return
+            item = ReviewItem(noun["spanish"], noun["english"], due_at=now or time.time())
+            item.variants = answer_variants(item.spanish, item.english)
+            self._items[item.spanish] = item
+            heapq.heappush(self._heap, (item.due_at, item.spanish))
+            self._store(item)
+
+    def peek(self):
+        """Return the item due soonest, or None if nothing is tracked."""
+        with self._lock:
+            while self._heap:
+                due_at, key = self._heap[0]
+                item = self._items.get(key)
+                if item is not None and item.due_at == due_at:
+                    return item
+                heapq.heappop(self._heap)  # superseded by a later record()
+            return None
+
+    def record(self, spanish, correct, now=None):
+        with self._lock:
+            item = self._items.get(spanish)
+            if item is None:
+                return
+            now = now or time.time()
+            item.review(CORRECT_QUALITY if correct else WRONG_QUALITY, now)
+            heapq.heappush(self._heap, (item.due_at, item.spanish))
+            self._store(item, (spanish, now, int(bool(correct))))
+        logger.info(
+            "Quiz answer for %s: %s, next review in %.1f days",
+            spanish,
+            "correct" if correct else "wrong",
+            item.interval / DAY,
+        )
+
+    @property
+    def history_synced(self):
+        """Whether the nouns saved before reviews existed were already added."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'history_synced'"
+            ).fetchone()
+        return row is not None
+
+    def mark_history_synced(self):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('history_synced', '1')")
+
+    def answers(self, after_id=0):
+        """(id, spanish, answered_at, correct) of every answer logged after after_id, oldest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, spanish, answered_at, correct FROM answers WHERE id > ? ORDER BY id",
+                (after_id,),
+            ).fetchall()
+
+    @staticmethod
+    def _dump_variants(item):
+        return json.dumps(
+            {key: sorted(value) for key, value in item.variants.items()}, ensure_ascii=False
+        )
+
+    def _store(self, item, answer=None):
+        with self._conn:
+            if answer is not None:
+                self._conn.execute(
+                    "INSERT INTO answers (spanish, answered_at, correct) VALUES (?, ?, ?)", answer
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reviews "
+                "(spanish, english, ease, interval, repetitions, due_at, variants) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    item.spanish,
+                    item.english,
+                    item.ease,
+                    item.interval,
+                    item.repetitions,
+                    item.due_at,
+                    self._dump_variants(item),
+                ),
+            )
+
+    def close(self):
+        self._conn.close()
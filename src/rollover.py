@@ -0,0 +1,58 @@
+import time
+from datetime import date, datetime, timedelta
+from logger import logger
+from utils import MS_IN_SECOND
+
+# Tk timers can run late across sleep or clock changes, so the date is re-checked
+# at least this often; a wake-up past midnight is caught within this bound.
+MAX_TIMER_DELAY = 60 * 60  # In seconds
+ROLLOVER_GRACE = 1  # In seconds past midnight, so the timer never fires just before it
+
+
+def seconds_until_midnight(now=None):
+    """Seconds from `now` (a timestamp) to the next local midnight; DST days are 23 or 25 h."""
+    now = time.time() if now is None else now
+    tomorrow = datetime.fromtimestamp(now).date() + timedelta(days=1)
+    # timestamp() of a naive datetime goes through mktime, which applies that day's UTC offset
+    return datetime.combine(tomorrow, datetime.min.time()).timestamp() - now
+
+
+class RolloverScheduler:
+    """
+    Calls on_rollover(day) on the Tk thread when the local date changes. One
+    timer is armed for the next midnight (capped at MAX_TIMER_DELAY); check()
+    is cheap and can also be called before anything that depends on the day.
+    """
+
+    def __init__(self, root, on_rollover):
+        self.root = root
+        self.on_rollover = on_rollover
+        self.day = date.today()
+        self._job = None
+
+    def start(self):
+        self._arm()
+
+    def _arm(self):
+        delay = min(seconds_until_midnight() + ROLLOVER_GRACE, MAX_TIMER_DELAY)
+        self._job = self.root.after(int(delay * MS_IN_SECOND), self._on_timer)
+
+    def _on_timer(self):
+        self._job = None
+        self.check()
+        self._arm()
+
+    def check(self):
+        """Run the rollover if the date changed since the last check; True if it did."""
+        today = date.today()
+        if today == self.day:
+            return False
+        logger.info("Date changed from %s to %s", self.day, today)
+        self.day = today
+        self.on_rollover(today)
+        return True
+
+    def stop(self):
+        if self._job:
+            self.root.after_cancel(self._job)
+            self._job = None
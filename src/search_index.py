@@ -0,0 +1,253 @@
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from paths import SEARCH_INDEX_FILE, FALLBACK_NOUNS_FILE
+from logger import logger
+from utils import atomic_replace
+from answer_matching import search_key
+from conjugator import PERSON_LABELS
+
+INDEX_VERSION = "1"
+DEFAULT_LIMIT = 20
+PREFIX_END = "\U0010ffff"  # Sorts after every character, so key < prefix + PREFIX_END is "starts with"
+# English words that say nothing about the meaning ("to run", "the house")
+STOP_WORDS = {"a", "an", "the", "to", "of", "be", "one", "oneself", "something", "someone"}
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE words (
+    id INTEGER PRIMARY KEY,
+    spanish TEXT NOT NULL,
+    english TEXT NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE TABLE spanish (
+    key TEXT NOT NULL,
+    word_id INTEGER NOT NULL REFERENCES words(id),
+    PRIMARY KEY (key, word_id)
+) WITHOUT ROWID;
+CREATE TABLE forms (
+    key TEXT NOT NULL,
+    form TEXT NOT NULL,
+    word_id INTEGER NOT NULL REFERENCES words(id),
+    mood TEXT NOT NULL,
+    tense TEXT NOT NULL,
+    person INTEGER NOT NULL,
+    PRIMARY KEY (key, word_id, mood, tense, person)
+) WITHOUT ROWID;
+CREATE TABLE glosses (
+    token TEXT NOT NULL,
+    word_id INTEGER NOT NULL REFERENCES words(id),
+    PRIMARY KEY (token, word_id)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class FormMatch:
+    form: str
+    infinitive: str
+    english: str
+    mood: str
+    tense: str
+    person: int  # Index into PERSON_LABELS
+
+    def describe(self):
+        return (
+            f"{self.form}: {self.infinitive} ({self.english}), "
+            f"{self.mood} {self.tense}, {PERSON_LABELS[self.person]}"
+        )
+
+
+@dataclass(frozen=True)
+class WordMatch:
+    spanish: str
+    english: str
+    kind: str  # "verb" or "noun"
+
+    def describe(self):
+        return f"{self.spanish}: {self.english} ({self.kind})"
+
+
+def gloss_tokens(text):
+    return [token for token in search_key(text).split() if token not in STOP_WORDS]
+
+
+def source_signature(verbs, vocabulary, nouns_file=FALLBACK_NOUNS_FILE):
+    """Changes whenever a source does: verb index build, fallback nouns file or pack imports."""
+    st = os.stat(nouns_file)
+    verbs_signature = verbs.signature() if verbs else "none"
+    # Vocabulary ids are dense and rows are never deleted, so the count is a version
+    return f"{INDEX_VERSION}:{verbs_signature}:{st.st_size}:{st.st_mtime_ns}:{len(vocabulary)}"
+
+
+def _source_words(verbs, vocabulary, nouns_file):
+    """Yield (spanish, english, kind) for every verb and noun the app can show."""
+    if verbs:
+        for infinitive, translation in verbs.verbs():
+            yield infinitive, translation, "verb"
+    with open(nouns_file, "r", encoding="utf-8") as f:
+        for entry in json.load(f):
+            yield entry["word"], entry["definition"], "noun"
+    for position in range(len(vocabulary)):
+        spanish, english = vocabulary.word(position)
+        yield spanish, english, "noun"
+
+
+def build_index(verbs, vocabulary, target=SEARCH_INDEX_FILE, nouns_file=FALLBACK_NOUNS_FILE):
+    """Compile the inverted indexes into SQLite (one pass, atomic replace)."""
+    logger.info("Building search index at %s", target)
+    with atomic_replace(target) as tmp:
+        conn = sqlite3.connect(tmp)
+        try:
+            conn.executescript(SCHEMA)
+            word_ids = {}
+            for spanish, english, kind in _source_words(verbs, vocabulary, nouns_file):
+                if (spanish, kind) in word_ids:
+                    continue
+                word_id = len(word_ids) + 1
+                word_ids[(spanish, kind)] = word_id
+                conn.execute(
+                    "INSERT INTO words VALUES (?, ?, ?, ?)", (word_id, spanish, english, kind)
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO spanish VALUES (?, ?)", (search_key(spanish), word_id)
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO glosses VALUES (?, ?)",
+                    ((token, word_id) for token in gloss_tokens(english)),
+                )
+
+            forms = 0
+            if verbs:
+                for infinitive, _, mood, tense, *persons in verbs.all_forms():
+                    word_id = word_ids[(infinitive, "verb")]
+                    rows = [
+                        (search_key(form), form, word_id, mood, tense, person)
+                        for person, form in enumerate(persons)
+                        if form
+                    ]
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO forms VALUES (?, ?, ?, ?, ?, ?)", rows
+                    )
+                    forms += len(rows)
+            conn.execute(
+                "INSERT INTO meta VALUES ('source', ?)",
+                (source_signature(verbs, vocabulary, nouns_file),),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    logger.info("Search index ready: %d words, %d forms", len(word_ids), forms)
+
+
+class SearchIndex:
+    """
+    Read-only lookups over the compiled search index: conjugated form to verb,
+    English gloss to words, and prefix search over Spanish. Keys are folded
+    (lowercase, no accents) and stored sorted in WITHOUT ROWID tables, so an
+    exact or prefix lookup is one B-tree range scan.
+    """
+
+    def __init__(self, path=SEARCH_INDEX_FILE):
+        uri = Path(path).resolve().as_uri() + "?mode=ro"
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, verbs, vocabulary, path=SEARCH_INDEX_FILE, nouns_file=FALLBACK_NOUNS_FILE):
+        """Open the index, (re)building it first if any source changed."""
+        signature = source_signature(verbs, vocabulary, nouns_file)
+        if not os.path.exists(path) or cls._signature(path) != signature:
+            build_index(verbs, vocabulary, path, nouns_file)
+        return cls(path)
+
+    @staticmethod
+    def _signature(path):
+        try:
+            conn = sqlite3.connect(path)
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def conjugated(self, form):
+        """Every (infinitive, mood, tense, person) a conjugated form belongs to; accents optional."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT form, spanish, english, mood, tense, person FROM forms "
+                "JOIN words ON words.id = forms.word_id WHERE key = ?",
+                (search_key(form),),
+            ).fetchall()
+        return [FormMatch(*row) for row in rows]
+
+    def spanish(self, prefix, limit=DEFAULT_LIMIT):
+        """Verbs and nouns whose Spanish starts with prefix."""
+        key = search_key(prefix)
+        if not key:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT spanish, english, kind FROM spanish "
+                "JOIN words ON words.id = spanish.word_id "
+                "WHERE key >= ? AND key < ? ORDER BY key LIMIT ?",
+                (key, key + PREFIX_END, limit),
+            ).fetchall()
+        return [WordMatch(*row) for row in rows]
+
+    def english(self, query, limit=DEFAULT_LIMIT):
+        """
+        Words whose translation has every query token, the last one as a prefix
+        so results follow typing ("tre" finds "tree").
+        """
+        tokens = gloss_tokens(query)
+        if not tokens:
+            return []
+        *exact, last = tokens
+        clauses = ["SELECT word_id FROM glosses WHERE token = ?"] * len(exact)
+        clauses.append("SELECT word_id FROM glosses WHERE token >= ? AND token < ?")
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT spanish, english, kind FROM words WHERE id IN ("
+                + " INTERSECT ".join(clauses)
+                + ") ORDER BY length(english), spanish LIMIT ?",
+                (*exact, last, last + PREFIX_END, limit),
+            ).fetchall()
+        return [WordMatch(*row) for row in rows]
+
+    def is_word(self, text):
+        """Whether text is a known Spanish word or form, or an English gloss word."""
+        key = search_key(text)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM spanish WHERE key = ? UNION ALL "
+                "SELECT 1 FROM forms WHERE key = ? UNION ALL "
+                "SELECT 1 FROM glosses WHERE token = ? LIMIT 1",
+                (key, key, key),
+            ).fetchone()
+        return row is not None
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Conjugated-form hits first, then Spanish prefix matches, then English ones."""
+        results = list(self.conjugated(query))
+        seen = set()
+        for match in self.spanish(query, limit) + self.english(query, limit):
+            if len(results) >= limit:
+                break
+            if match not in seen:
+                seen.add(match)
+                results.append(match)
+        return results[:limit]
+
+    def close(self):
+        self._conn.close()
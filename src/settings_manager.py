@@ -1,26 +1,121 @@
 import json
+import threading
+from dataclasses import dataclass, asdict, fields, replace
 from paths import SETTINGS_FILE
-from logger import logger
-from utils import format_seconds
+from logger import logger, DEFAULT_LOG_LEVEL, DEFAULT_LOG_FORMAT
+from utils import atomic_write, format_seconds
+from defaults import (
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_PREFETCH_SIZE,
+    DEFAULT_NOUN_SOURCE,
+)
 
 DEFAULT_QUIZ_INTERVAL = 60 * 60  # In seconds
+SAVE_DEBOUNCE = 1.0  # In seconds, changes within this window share one write
 
 
-def save_settings(enabled: bool, interval: int):
-    data = {"quiz_enabled": enabled, "quiz_interval": interval}
-    logger.info(
-        f"Settings changed. Saving {data}.\nQuiz interval readable format: {format_seconds(interval)}"
-    )
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+@dataclass(frozen=True)
+class Settings:
+    quiz_enabled: bool = True
+    quiz_interval: int = DEFAULT_QUIZ_INTERVAL
+    conjugation_cache_ttl: int = DEFAULT_CACHE_TTL
+    conjugation_cache_size: int = DEFAULT_CACHE_SIZE
+    prefetch_size: int = DEFAULT_PREFETCH_SIZE
+    noun_source: str = DEFAULT_NOUN_SOURCE
+    metrics_enabled: bool = True
+    log_level: str = DEFAULT_LOG_LEVEL
+    log_format: str = DEFAULT_LOG_FORMAT
 
 
-def load_settings():
+def _coerce(raw, path):
+    """Settings from a parsed dict; missing or mistyped keys fall back to their default."""
+    values = {}
+    for field in fields(Settings):
+        if field.name not in raw:
+            continue
+        value = raw[field.name]
+        # JSON written by other tools may hold 3600.0 for 3600
+        if field.type is int and isinstance(value, float) and value.is_integer():
+            value = int(value)
+        # bool is an int subclass, so check it explicitly for int fields
+        if isinstance(value, field.type) and not (
+            field.type is int and isinstance(value, bool)
+        ):
+            values[field.name] = value
+        else:
+            logger.warning(
+                "Ignoring %s=%r in %s, expected %s",
+                field.name,
+                value,
+                path,
+                field.type.__name__,
+            )
+    return Settings(**values)
+
+
+def load_settings(path=SETTINGS_FILE) -> Settings:
     try:
-        logger.info(f"Reading {SETTINGS_FILE}")
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            logger.info(f"Found saved data")
-            return json.load(f)
+        logger.info("Reading %s", path)
+        with open(path, "r", encoding="utf-8") as f:
+            logger.info("Found saved data")
+            return _coerce(json.load(f), path)
     except (FileNotFoundError, json.JSONDecodeError):
-        logger.info(f"Saved data not found, using defaults")
-        return {"quiz_enabled": True, "quiz_interval": DEFAULT_QUIZ_INTERVAL}
+        logger.info("Saved data not found, using defaults")
+        return Settings()
+
+
+class SettingsService:
+    """
+    The settings in memory. update() applies changes at once, tells subscribers
+    which keys changed and schedules a debounced write (temp file + rename) on
+    a timer thread, so bursts of changes cost one write off the Tk thread.
+    """
+
+    def __init__(self, path=SETTINGS_FILE, debounce=SAVE_DEBOUNCE):
+        self.path = path
+        self.debounce = debounce
+        self.current = load_settings(path)
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def subscribe(self, callback, keys=None):
+        """Call callback(changed: dict) after updates touching any of `keys` (all if None)."""
+        self._subscribers.append((callback, set(keys) if keys else None))
+
+    def update(self, **changes):
+        unknown = set(changes) - {f.name for f in fields(Settings)}
+        if unknown:
+            raise KeyError(f"Unknown settings: {', '.join(sorted(unknown))}")
+        changed = {k: v for k, v in changes.items() if getattr(self.current, k) != v}
+        if not changed:
+            return
+        self.current = replace(self.current, **changed)
+        logger.info("Settings changed: %s", changed)
+        if "quiz_interval" in changed:
+            logger.info(
+                "Quiz interval readable format: %s", format_seconds(self.current.quiz_interval)
+            )
+        self._schedule_save()
+        for callback, keys in self._subscribers:
+            if keys is None or keys & changed.keys():
+                callback(changed)
+
+    def _schedule_save(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Write a pending change now (also called on quit to skip the debounce)."""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer.cancel()
+            self._timer = None
+            atomic_write(self.path, json.dumps(asdict(self.current), indent=2))
+        logger.info("Saved settings to %s", self.path)
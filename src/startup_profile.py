@@ -0,0 +1,36 @@
+import time
+from logger import logger
+
+FIRST_PAINT_TARGET_MS = 200
+
+
+class StartupProfile:
+    """Wall-clock time per startup phase, measured from process start."""
+
+    def __init__(self, started_at=None):
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self._last = self.started_at
+        self.phases = []  # (name, ms spent in phase)
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+
+    def total_ms(self, until=None):
+        total = 0.0
+        for phase, ms in self.phases:
+            total += ms
+            if phase == until:
+                break
+        return total
+
+    def report(self):
+        lines = ["Startup profile:"]
+        lines += [f"  {phase:<14}{ms:8.1f} ms" for phase, ms in self.phases]
+        first_paint = self.total_ms("first paint")
+        lines.append(
+            f"  {'to first paint':<14}{first_paint:8.1f} ms"
+            f" (target {FIRST_PAINT_TARGET_MS} ms)"
+        )
+        logger.info("\n".join(lines))
@@ -1,11 +1,8 @@
 import tkinter as tk
-from tkinter import ttk
 import threading
-import pystray
-from PIL import Image
 from paths import TRAY_ICON
 from logger import logger
-from settings_manager import save_settings
+from profiles import list_profiles, validate_name
 
 
 class TrayController:
@@ -13,12 +10,19 @@ class TrayController:
         """
         app: reference to your main SpanishWidgetApp
         """
+        # pystray and PIL are slow to import; they load here, after the first paint
+        import pystray
+        from PIL import Image
+
         self.app = app
         self.icon = pystray.Icon(
             "SpanishWidget", Image.open(TRAY_ICON), "Spanish Widget"
         )
         self.menu = pystray.Menu(
             pystray.MenuItem("Refresh Now", self.refresh_now),
+            pystray.MenuItem("Search", self.open_search),
+            # Rebuilt each time the menu opens, so new profiles show up
+            pystray.MenuItem("Profile", pystray.Menu(self._profile_items)),
             pystray.MenuItem("Settings", self.open_settings),
             pystray.MenuItem("Quit", self.quit_app),
         )
@@ -42,16 +46,53 @@ class TrayController:
                 initialvalue=self.app.quiz_interval,
             )
             if interval and interval > 0:
-                self.app.quiz_interval = interval
-                today = self.app.manager.get_today()
-                if today:
-                    self.app.schedule_quiz(today["noun"])
+                self.app.set_quiz_interval(interval)
 
         # Run on Tk main thread
         self.app.root.after(0, ask)
 
+    def _profile_items(self):
+        import pystray
+
+        def entry(name):
+            # pystray counts an action's parameters, so no name=name default here
+            return pystray.MenuItem(
+                name,
+                lambda icon, item: self.switch_profile(name),
+                checked=lambda item: self.app.profile_name == name,
+                radio=True,
+            )
+
+        return [entry(name) for name in list_profiles(self.app.data_dir)] + [
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("New Profile...", self.new_profile),
+        ]
+
+    def switch_profile(self, name):
+        self.app.root.after(0, self.app.switch_profile, name)
+
+    def new_profile(self, icon, item):
+        def ask():
+            import tkinter.simpledialog as simpledialog
+            from tkinter import messagebox
+
+            name = simpledialog.askstring("New Profile", "Profile name:")
+            if not name:
+                return
+            try:
+                validate_name(name.strip())
+            except ValueError as e:
+                messagebox.showerror("New Profile", str(e))
+                return
+            self.app.switch_profile(name.strip())
+            self.icon.update_menu()
+
+        self.app.root.after(0, ask)
+
     def open_settings(self, icon, item):
         def show():
+            from tkinter import ttk
+
             if hasattr(self, "_settings_win") and self._settings_win.winfo_exists():
                 self._settings_win.lift()
                 return
@@ -91,11 +132,10 @@ class TrayController:
             btn_frame.pack(side="bottom", fill="x", pady=(15, 0))
 
             def save_and_close():
-                quiz_enabled = quiz_var.get()
-                quiz_interval = interval_var.get()
-                self.app.set_quiz_interval(quiz_interval)
-                self.app.set_quiz_enabled(quiz_enabled)
-                save_settings(quiz_enabled, quiz_interval)
+                # One update: one notification and one (debounced) write
+                self.app.settings.update(
+                    quiz_enabled=quiz_var.get(), quiz_interval=interval_var.get()
+                )
                 win.destroy()
 
             ttk.Button(btn_frame, text="Save & Close", command=save_and_close).pack(
@@ -104,9 +144,73 @@ class TrayController:
 
         self.app.root.after(0, show)
 
+    def open_search(self, icon, item):
+        def show():
+            from tkinter import ttk
+
+            if hasattr(self, "_search_win") and self._search_win.winfo_exists():
+                self._search_win.lift()
+                return
+
+            win = tk.Toplevel(self.app.root)
+            win.title("Search")
+            win.geometry("420x320")
+            self._search_win = win
+
+            container = ttk.Frame(win, padding=10)
+            container.pack(fill="both", expand=True)
+
+            query_var = tk.StringVar()
+            entry = ttk.Entry(container, textvariable=query_var, state="disabled")
+            entry.pack(fill="x")
+            status = ttk.Label(container, text="Building search index...")
+            status.pack(anchor="w", pady=(5, 5))
+            results = tk.Listbox(container)
+            results.pack(fill="both", expand=True)
+
+            def update(*_):
+                matches = self.app.manager.search(query_var.get())
+                results.delete(0, "end")
+                for match in matches:
+                    results.insert("end", match.describe())
+                status.config(text=f"{len(matches)} results" if query_var.get() else "")
+
+            # The first open may build the index; do it off the Tk thread
+            ready = threading.Event()
+            failed = []
+
+            def load():
+                try:
+                    self.app.manager.search_index
+                except Exception as e:
+                    logger.error("Search index unavailable: %s", e)
+                    failed.append(e)
+                finally:
+                    ready.set()
+
+            threading.Thread(target=load, daemon=True).start()
+
+            def wait_for_index():
+                if not win.winfo_exists():
+                    return
+                if not ready.is_set():
+                    win.after(100, wait_for_index)
+                    return
+                if failed:
+                    status.config(text="Search index unavailable, see the log")
+                    return
+                entry.config(state="normal")
+                status.config(text="Type a Spanish word, a conjugated form or English")
+                query_var.trace_add("write", update)
+                entry.focus_set()
+
+            wait_for_index()
+
+        self.app.root.after(0, show)
+
     def refresh_now(self):
         logger.info("Manual refresh triggered from tray")
-        self.app.root.after(0, self.app.regenerate_data_for_today) 
+        self.app.request_refresh()
 
     def quit_app(self, icon, item):
         logger.info("Quitting the app")
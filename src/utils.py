@@ -1,3 +1,9 @@
+import os
+from contextlib import contextmanager
+
+MS_IN_SECOND = 1000
+
+
 def format_seconds(seconds: int) -> str:
     # human readable
     hrs, rem = divmod(seconds, 3600)
@@ -10,3 +16,28 @@ def format_seconds(seconds: int) -> str:
     if secs or not parts:
         parts.append(f"{secs}s")
     return " ".join(parts)
+
+
+@contextmanager
+def atomic_replace(path):
+    """
+    Yield a temporary path next to `path` to build the new file in; it replaces
+    `path` only if the block completes, so readers never see a partial file.
+    """
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):  # left over from an interrupted run
+        os.remove(tmp)
+    try:
+        yield tmp
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+
+def atomic_write(path, data):
+    """Write text to `path` through a temporary file and a rename."""
+    with atomic_replace(path) as tmp:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
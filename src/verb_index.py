@@ -0,0 +1,152 @@
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from paths import LOOKUP_FILE, VERB_INDEX_FILE
+from logger import logger
+from utils import atomic_replace
+
+INDEX_VERSION = "1"
+MMAP_SIZE = 64 * 1024 * 1024  # Upper bound, SQLite only maps what the file needs
+
+# Jehle column names for the six persons, in table order
+PERSON_FIELDS = ("form_1s", "form_2s", "form_3s", "form_1p", "form_2p", "form_3p")
+
+SCHEMA = f"""
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE verbs (
+    id INTEGER PRIMARY KEY,
+    infinitive TEXT NOT NULL UNIQUE,
+    translation TEXT NOT NULL
+);
+CREATE TABLE forms (
+    verb_id INTEGER NOT NULL REFERENCES verbs(id),
+    mood TEXT NOT NULL,
+    tense TEXT NOT NULL,
+    {", ".join(f"{field} TEXT" for field in PERSON_FIELDS)},
+    PRIMARY KEY (verb_id, mood, tense)
+) WITHOUT ROWID;
+"""
+
+
+def _source_signature(path):
+    st = os.stat(path)
+    return f"{INDEX_VERSION}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def build_index(source=LOOKUP_FILE, target=VERB_INDEX_FILE):
+    """Compile the Jehle JSON lookup into a compact SQLite index (one pass, atomic replace)."""
+    logger.info("Building verb index from %s", source)
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    with atomic_replace(target) as tmp:
+        conn = sqlite3.connect(tmp)
+        try:
+            conn.executescript(SCHEMA)
+            verb_id = 0
+            for entries in data.values():
+                present = next((e for e in entries if e.get("tense") == "Present"), None)
+                if present is None:
+                    continue
+                verb_id += 1
+                conn.execute(
+                    "INSERT INTO verbs (id, infinitive, translation) VALUES (?, ?, ?)",
+                    (verb_id, present["infinitive"], present["translation"]),
+                )
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO forms VALUES (?, ?, ?, {', '.join('?' * len(PERSON_FIELDS))})",
+                    [
+                        (verb_id, e.get("mood", ""), e["tense"])
+                        + tuple(e.get(field) for field in PERSON_FIELDS)
+                        for e in entries
+                        if e.get("tense")
+                    ],
+                )
+            conn.execute(
+                "INSERT INTO meta VALUES ('source', ?)", (_source_signature(source),)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    logger.info("Verb index ready: %d verbs written to %s", verb_id, target)
+
+
+class VerbIndex:
+    """Read-only, memory-mapped view over the compiled verb index."""
+
+    def __init__(self, path=VERB_INDEX_FILE):
+        uri = Path(path).resolve().as_uri() + "?mode=ro"
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self._lock = threading.Lock()
+        self.count = self._conn.execute("SELECT COUNT(*) FROM verbs").fetchone()[0]
+
+    @classmethod
+    def open(cls, source=LOOKUP_FILE, path=VERB_INDEX_FILE):
+        """Open the index, (re)building it first if the JSON source changed."""
+        if os.path.exists(source):
+            if not os.path.exists(path) or cls._stale(path, source):
+                build_index(source, path)
+        return cls(path)
+
+    @staticmethod
+    def _stale(path, source):
+        try:
+            conn = sqlite3.connect(path)
+            try:
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'source'"
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return True
+        return row is None or row[0] != _source_signature(source)
+
+    def verb(self, position):
+        """Return (infinitive, translation) of the verb at 0-based position < count."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT infinitive, translation FROM verbs WHERE id = ?", (position + 1,)
+            ).fetchone()
+
+    def verbs(self):
+        """Return every (infinitive, translation) pair, in index order."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT infinitive, translation FROM verbs ORDER BY id"
+            ).fetchall()
+
+    def all_forms(self):
+        """Return (infinitive, translation, mood, tense, 1s, 2s, 3s, 1p, 2p, 3p) for every row."""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT infinitive, translation, mood, tense, {', '.join(PERSON_FIELDS)} "
+                "FROM forms JOIN verbs ON verbs.id = forms.verb_id ORDER BY verbs.id"
+            ).fetchall()
+
+    def signature(self):
+        """Identifies the JSON source the index was built from."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        return row[0] if row else ""
+
+    def forms(self, infinitive, mood):
+        """Return {tense: (1s, 2s, 3s, 1p, 2p, 3p)} for one verb and mood, or {} if unknown."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT tense, {', '.join(PERSON_FIELDS)} FROM forms "
+                "JOIN verbs ON verbs.id = forms.verb_id "
+                "WHERE verbs.infinitive = ? AND forms.mood = ?",
+                (infinitive, mood),
+            ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,130 @@
+"""Import vocabulary packs into the noun store the widget draws from.
+
+Supported: .csv, .tsv, .jsonl/.ndjson and Anki "Notes in Plain Text" exports (.txt).
+Each file is streamed row by row and written in batches, so memory stays flat.
+
+    python src/vocab_import.py pack.csv [more packs ...]
+"""
+import argparse
+import csv
+import html
+import json
+import os
+import re
+import time
+from itertools import islice
+from logger import logger
+from vocabulary import VocabularyStore
+
+BATCH_SIZE = 5000  # Rows per INSERT transaction
+HEADER_NAMES = {"spanish", "english", "word", "definition", "front", "back"}
+HTML_TAG = re.compile(r"<[^>]+>")
+
+
+def _columns(rows):
+    """(spanish, english) from the first two columns, skipping a header row and blanks."""
+    for i, row in enumerate(rows):
+        if len(row) < 2:
+            continue
+        spanish, english = row[0].strip(), row[1].strip()
+        if i == 0 and spanish.lower() in HEADER_NAMES:
+            continue
+        if spanish and english:
+            yield spanish, english
+
+
+def read_delimited(f, delimiter):
+    return _columns(csv.reader(f, delimiter=delimiter))
+
+
+def read_jsonl(f):
+    for number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.warning("Skipping malformed JSON on line %d: %s", number, e)
+            continue
+        if not isinstance(entry, dict):
+            logger.warning("Skipping line %d: expected an object", number)
+            continue
+        spanish = entry.get("spanish") or entry.get("word")
+        english = entry.get("english") or entry.get("definition")
+        if not (isinstance(spanish, str) and isinstance(english, str)):
+            continue
+        spanish, english = spanish.strip(), english.strip()
+        if spanish and english:
+            yield spanish, english
+
+
+def read_anki(f):
+    # Header lines look like "#separator:tab"; fields may carry HTML
+    separator = "\t"
+    body = []
+    for line in f:
+        if line.startswith("#"):
+            if line.startswith("#separator:"):
+                name = line.split(":", 1)[1].strip().lower()
+                separator = {"tab": "\t", "comma": ",", "semicolon": ";", "pipe": "|"}.get(
+                    name, separator
+                )
+            continue
+        body.append(line)
+        break
+    lines = (line for chunk in (body, f) for line in chunk)
+    for spanish, english in _columns(csv.reader(lines, delimiter=separator)):
+        yield (
+            html.unescape(HTML_TAG.sub("", spanish)).strip(),
+            html.unescape(HTML_TAG.sub("", english)).strip(),
+        )
+
+
+READERS = {
+    ".csv": lambda f: read_delimited(f, ","),
+    ".tsv": lambda f: read_delimited(f, "\t"),
+    ".jsonl": read_jsonl,
+    ".ndjson": read_jsonl,
+    ".txt": read_anki,
+}
+
+
+def import_pack(path, store=None):
+    """Stream one pack into the store. Returns (rows read, rows added)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Unsupported pack format: {ext or path}")
+    if store is None:
+        store = VocabularyStore()
+    pack = os.path.basename(path)
+
+    read = added = 0
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        rows = READERS[ext](f)
+        while True:
+            batch = list(islice(rows, BATCH_SIZE))
+            if not batch:
+                break
+            read += len(batch)
+            added += store.add_many(batch, pack)
+    logger.info("Imported %s: %d rows read, %d new words", pack, read, added)
+    return read, added
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("packs", nargs="+")
+    args = parser.parse_args()
+
+    store = VocabularyStore()
+    for path in args.packs:
+        start = time.perf_counter()
+        read, added = import_pack(path, store)
+        elapsed = time.perf_counter() - start
+        print(f"{path}: {read} rows, {added} new, {read / elapsed:.0f} rows/s")
+    print(f"store now holds {len(store)} words")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import sqlite3
+import threading
+from paths import VOCABULARY_FILE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    spanish TEXT NOT NULL,
+    english TEXT NOT NULL,
+    pack TEXT NOT NULL
+);
+"""
+
+
+def word_key(spanish: str) -> str:
+    return " ".join(spanish.lower().split())
+
+
+class VocabularyStore:
+    """
+    Imported nouns, one row per distinct Spanish word. Ids are dense (rows are
+    never deleted), so a draw by position is a primary-key lookup.
+    """
+
+    def __init__(self, path=VOCABULARY_FILE):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def __len__(self):
+        # Dense ids make MAX(id) the row count, read from the end of the b-tree
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM words").fetchone()[0]
+
+    def add_many(self, pairs, pack):
+        """Insert (spanish, english) pairs; words already stored are skipped. Returns rows added."""
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO words (key, spanish, english, pack) VALUES (?, ?, ?, ?)",
+                ((word_key(spanish), spanish, english, pack) for spanish, english in pairs),
+            )
+            return self._conn.total_changes - before
+
+    def word(self, position):
+        """Return (spanish, english) of the word at 0-based position < len(self)."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT spanish, english FROM words WHERE id = ?", (position + 1,)
+            ).fetchone()
+
+    def words(self):
+        """Return every Spanish word in id order."""
+        with self._lock:
+            rows = self._conn.execute("SELECT spanish FROM words ORDER BY id").fetchall()
+        return [spanish for (spanish,) in rows]
+
+    def close(self):
+        self._conn.close()
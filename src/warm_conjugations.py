@@ -0,0 +1,120 @@
+"""Warm the conjugation cache for every infinitive in the Jehle verb list, headless.
+
+Verbs the local index can conjugate need nothing. The rest are fetched on a bounded
+worker pool and stored in the conjugation cache as they finish, so an interrupted run
+resumes where it stopped: verbs already cached are skipped.
+
+    python src/warm_conjugations.py [--workers 4] [--rate 2] [--url https://host/conjugate/{verb}]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logger import logger
+from conjugation_cache import ConjugationCache
+from conjugator import conjugation_table
+from data_manager import CONJUGATION_URL, scrape_conjugation
+from http_client import get_client, REQUESTS_PER_SECOND
+from paths import SETTINGS_FILE
+from profiles import migrate_to_profiles, profile_file
+from settings_manager import load_settings
+from verb_index import VerbIndex
+
+DEFAULT_WORKERS = 4
+REPORT_EVERY = 50  # Fetched verbs between progress lines
+MAX_LISTED_FAILURES = 20
+
+
+def warm(index, cache, http, workers=DEFAULT_WORKERS, url=CONJUGATION_URL):
+    """Returns a dict of counts plus the list of failed verbs."""
+    stats = {"local": 0, "cached": 0, "fetched": 0, "not_found": 0, "failed": []}
+    pending = []
+    for infinitive, _ in index.verbs():
+        if conjugation_table(index, infinitive):
+            stats["local"] += 1
+        elif cache.contains(infinitive):
+            stats["cached"] += 1
+        else:
+            pending.append(infinitive)
+    logger.info(
+        "%d verbs local, %d already cached, %d to fetch",
+        stats["local"],
+        stats["cached"],
+        len(pending),
+    )
+
+    start = time.perf_counter()
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warm") as pool:
+        futures = {pool.submit(scrape_conjugation, http, verb, url): verb for verb in pending}
+        try:
+            for future in as_completed(futures):
+                verb = futures[future]
+                try:
+                    table = future.result()
+                except Exception as e:
+                    logger.warning("Fetching %s failed: %s", verb, e)
+                    stats["failed"].append(verb)
+                else:
+                    if table:
+                        cache.put(verb, table)  # committed per verb, so a rerun resumes here
+                        stats["fetched"] += 1
+                    else:
+                        stats["not_found"] += 1
+                done += 1
+                if done % REPORT_EVERY == 0:
+                    elapsed = time.perf_counter() - start
+                    logger.info(
+                        "%d/%d fetched, %.1f verbs/s", done, len(pending), done / elapsed
+                    )
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            logger.info("Interrupted after %d/%d verbs, rerun to resume", done, len(pending))
+            raise
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+def positive_float(text):
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {text}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--url", default=CONJUGATION_URL, help="{verb} is replaced")
+    parser.add_argument(
+        "--rate", type=positive_float, default=REQUESTS_PER_SECOND, help="requests per second"
+    )
+    args = parser.parse_args()
+
+    migrate_to_profiles()
+    settings = load_settings(profile_file(SETTINGS_FILE))
+    index = VerbIndex.open()
+    cache = ConjugationCache(
+        ttl=settings.conjugation_cache_ttl, max_entries=settings.conjugation_cache_size
+    )
+    # Room for the whole list, kept in the cache file so the app does not evict
+    # the warmed entries down to its own size on its next put()
+    cache.reserve(index.count)
+    http = get_client()
+    http.rate = args.rate
+    stats = warm(index, cache, http, args.workers, args.url)
+
+    fetched = stats["fetched"] + stats["not_found"] + len(stats["failed"])
+    rate = fetched / stats["elapsed"] if stats["elapsed"] else 0
+    print(
+        f"local: {stats['local']}, already cached: {stats['cached']}, "
+        f"fetched: {stats['fetched']}, not found: {stats['not_found']}, "
+        f"failed: {len(stats['failed'])}"
+    )
+    print(f"{fetched} requests in {stats['elapsed']:.1f} s ({rate:.1f} verbs/s)")
+    if stats["failed"]:
+        print("failed: " + ", ".join(stats["failed"][:MAX_LISTED_FAILURES]))
+
+
+if __name__ == "__main__":
+    main()